@@ -351,13 +351,10 @@ class AnnotationsImpl:
         """
         data = kwargs
         if isinstance(annotation, list):
-            results = []
             ids_chunks = get_chunks(annotation, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['annotations'] = ids_chunk
-                descs = self._provider.post('describe-annotations', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-annotations', [{**data, 'annotations': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['annotation'] = annotation
             desc = self._provider.post('describe-annotation', data=data)
@@ -385,9 +382,9 @@ class AnnotationsImpl:
             annotation = [annotation]
 
         ids_chunks = get_chunks(annotation, self._provider.max_per_delete)
-        for ids_chunk in ids_chunks:
-            data['annotations'] = ids_chunk
-            self._provider.post('delete-annotations', data=data, as_json=False)
+        self._provider.post_many(
+            'delete-annotations', [{**data, 'annotations': ids_chunk} for ids_chunk in ids_chunks],
+            as_json=False)
 
     def restore(self, annotation: SomeResourceIds, **kwargs):
         """Restore an annotation or multiple annotations.
@@ -28,13 +28,10 @@ class CompaniesImpl:
         """
         data = kwargs
         if isinstance(company, list):
-            results = []
             ids_chunks = get_chunks(company, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['companies'] = ids_chunk
-                descs = self._provider.post('describe-companies', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-companies', [{**data, 'companies': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['company'] = company
             desc = self._provider.post('describe-company', data=data)
@@ -106,13 +106,10 @@ class CarriersImpl:
         """
         data = kwargs
         if isinstance(carrier, list):
-            results = []
             ids_chunks = get_chunks(carrier, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['carriers'] = ids_chunk
-                descs = self._provider.post('describe-carriers', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-carriers', [{**data, 'carriers': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['carrier'] = carrier
             desc = self._provider.post('describe-carrier', data=data)
@@ -121,13 +121,10 @@ class CarrierModelsImpl:
         """
         data = kwargs
         if isinstance(carrier_models, list):
-            results = []
             ids_chunks = get_chunks(carrier_models, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['carrier_models'] = ids_chunk
-                descs = self._provider.post('describe-carrier-models', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-carrier-models', [{**data, 'carrier_models': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['carrier_model'] = carrier_models
             desc = self._provider.post('describe-carrier-model', data=data)
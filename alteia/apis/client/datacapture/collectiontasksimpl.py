@@ -170,13 +170,10 @@ class CollectionTaskImpl:
         if fields:
             data["fields"] = fields
         if isinstance(task, list):
-            results = []
             ids_chunks = get_chunks(task, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['tasks'] = ids_chunk
-                descs = self._provider.post('describe-tasks', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-tasks', [{**data, 'tasks': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['task'] = task
             desc = self._provider.post('describe-task', data=data)
@@ -62,13 +62,10 @@ class PilotsImpl:
                 """
         data = kwargs
         if isinstance(pilot, list):
-            results = []
             ids_chunks = get_chunks(pilot, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['pilots'] = ids_chunk
-                descs = self._provider.post('describe-pilots', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-pilots', [{**data, 'pilots': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['pilot'] = pilot
             desc = self._provider.post('describe-pilot', data=data)
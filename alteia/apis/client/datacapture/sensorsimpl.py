@@ -113,13 +113,10 @@ class SensorsImpl:
         """
         data = kwargs
         if isinstance(sensor, list):
-            results = []
             ids_chunks = get_chunks(sensor, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['sensors'] = ids_chunk
-                descs = self._provider.post('describe-sensors', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-sensors', [{**data, 'sensors': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['sensor'] = sensor
             desc = self._provider.post('describe-sensor', data=data)
@@ -149,13 +149,10 @@ class SensorsModelsImpl:
         """
         data = kwargs
         if isinstance(sensor_models, list):
-            results = []
             ids_chunks = get_chunks(sensor_models, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['sensor_models'] = ids_chunk
-                descs = self._provider.post('describe-sensor-models', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-sensor-models', [{**data, 'sensor_models': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['sensor_model'] = sensor_models
             desc = self._provider.post('describe-sensor-model', data=data)
@@ -94,13 +94,10 @@ class TeamsImpl:
         """
         data = kwargs
         if isinstance(team, list):
-            results = []
             ids_chunks = get_chunks(team, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['teams'] = ids_chunk
-                descs = self._provider.post('describe-teams', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-teams', [{**data, 'teams': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['team'] = team
             desc = self._provider.post('describe-team', data=data)
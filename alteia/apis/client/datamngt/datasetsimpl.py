@@ -739,13 +739,10 @@ class DatasetsImpl:
         """
         data = kwargs
         if isinstance(dataset, list):
-            results = []
             ids_chunks = get_chunks(dataset, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['datasets'] = ids_chunk
-                descs = self._provider.post('describe-datasets', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-datasets', [{**data, 'datasets': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['dataset'] = dataset
             desc = self._provider.post('describe-dataset', data=data)
@@ -767,9 +764,9 @@ class DatasetsImpl:
             dataset = [dataset]
 
         ids_chunks = get_chunks(dataset, self._provider.max_per_delete)
-        for ids_chunk in ids_chunks:
-            data['datasets'] = ids_chunk
-            self._provider.post('delete-datasets', data=data, as_json=False)
+        self._provider.post_many(
+            'delete-datasets', [{**data, 'datasets': ids_chunk} for ids_chunk in ids_chunks],
+            as_json=False)
 
     def restore(self, dataset: SomeResourceIds, **kwargs):
         """Restore a dataset or multiple datasets.
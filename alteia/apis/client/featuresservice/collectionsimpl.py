@@ -90,13 +90,10 @@ class CollectionsImpl:
             # Do not request too many collections at a time, the provider can do better
             # for other describes, but we have to use smaller value for collections
             max_per_chunk = min(10, self._provider.max_per_describe)
-            results = []
             ids_chunks = get_chunks(collection, max_per_chunk)
-            for ids_chunk in ids_chunks:
-                data['collections'] = ids_chunk
-                descs = self._provider.post('describe-collections', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-collections', [{**data, 'collections': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['collection'] = collection
             desc = self._provider.post('describe-collection', data=data)
@@ -122,9 +119,9 @@ class CollectionsImpl:
             path = 'delete-collections' if not permanent \
                 else 'delete-collections-permanently'
             ids_chunks = get_chunks(collection, self._provider.max_per_delete)
-            for ids_chunk in ids_chunks:
-                data['collections'] = ids_chunk
-                self._provider.post(path, data=data, as_json=False)
+            self._provider.post_many(
+                path, [{**data, 'collections': ids_chunk} for ids_chunk in ids_chunks],
+                as_json=False)
         else:
             path = 'delete-collection' if not permanent \
                 else 'delete-collection-permanently'
@@ -161,13 +161,10 @@ class FeaturesImpl:
         """
         data = kwargs
         if isinstance(feature, list):
-            results = []
             ids_chunks = get_chunks(feature, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['features'] = ids_chunk
-                descs = self._provider.post('describe-features', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-features', [{**data, 'features': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['feature'] = feature
             desc = self._provider.post('describe-feature', data=data)
@@ -193,9 +190,9 @@ class FeaturesImpl:
             path = 'delete-features' if not permanent \
                 else 'delete-features-permanently'
             ids_chunks = get_chunks(feature, self._provider.max_per_delete)
-            for ids_chunk in ids_chunks:
-                data['features'] = ids_chunk
-                self._provider.post(path, data=data, as_json=False)
+            self._provider.post_many(
+                path, [{**data, 'features': ids_chunk} for ids_chunk in ids_chunks],
+                as_json=False)
         else:
             path = 'delete-feature' if not permanent \
                 else 'delete-feature-permanently'
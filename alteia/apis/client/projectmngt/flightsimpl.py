@@ -32,13 +32,10 @@ class FlightsImpl:
         """
         data = kwargs
         if isinstance(flight, list):
-            results = []
             ids_chunks = get_chunks(flight, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['flights'] = ids_chunk
-                descs = self._provider.post('describe-flights', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-flights', [{**data, 'flights': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['flight'] = flight
             desc = self._provider.post('describe-flight', data=data)
@@ -223,13 +223,10 @@ class MissionsImpl:
         """
         data = kwargs
         if isinstance(mission, list):
-            results = []
             ids_chunks = get_chunks(mission, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['missions'] = ids_chunk
-                descs = self._provider.post('describe-missions', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-missions', [{**data, 'missions': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['mission'] = mission
             desc = self._provider.post('describe-mission', data=data)
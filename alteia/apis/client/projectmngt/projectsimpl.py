@@ -7,10 +7,12 @@ from alteia.apis.provider import ProjectManagerAPI
 from alteia.core.errors import QueryError, ResponseError
 from alteia.core.resources.projectmngt.projects import Project
 from alteia.core.resources.resource import Resource, ResourcesWithTotal
-from alteia.core.resources.utils import search, search_generator
+from alteia.core.resources.utils import create_many, search, search_generator
 from alteia.core.utils.typing import ResourceId, SomeResourceIds, SomeResources
 from alteia.core.utils.utils import get_chunks
 
+_ALLOWED_PROJECT_STATUS = frozenset(('pending', 'available', 'failed', 'maintenance'))
+
 
 class ProjectsImpl:
     def __init__(self, project_manager_api: ProjectManagerAPI, **kwargs):
@@ -55,6 +57,29 @@ class ProjectsImpl:
         project_desc = content['project']
         return Project(**project_desc)
 
+    def create_many(self, *, names: List[str], company: ResourceId, **kwargs) -> List[Project]:
+        """Create several projects.
+
+        The projects are created concurrently.
+
+        Args:
+            names: Project names, one project is created per name.
+
+            company: Company identifier.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the ``create`` method for every project.
+
+        Raises:
+            QueryError: A project creation response is incorrect.
+
+        Returns:
+            Projects: The created projects, in the order of ``names``.
+
+        """
+        items = [{**kwargs, 'name': name, 'company': company} for name in names]
+        return create_many(self, items=items)
+
     def describe(self, project: SomeResourceIds, **kwargs) -> SomeResources:
         """Describe a project or a list of projects.
 
@@ -71,13 +96,10 @@ class ProjectsImpl:
         """
         data = kwargs
         if isinstance(project, list):
-            results = []
             ids_chunks = get_chunks(project, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['projects'] = ids_chunk
-                descs = self._provider.post('describe-projects', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-projects', [{**data, 'projects': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['project'] = project
             desc = self._provider.post('describe-project', data=data)
@@ -230,9 +252,8 @@ class ProjectsImpl:
             Project: Updated project resource.
 
         """
-        available_status = ['pending', 'available', 'failed', 'maintenance']
-        if status not in available_status:
-            raise RuntimeError(f'Status not in {available_status}')
+        if status not in _ALLOWED_PROJECT_STATUS:
+            raise RuntimeError(f'Status not in {sorted(_ALLOWED_PROJECT_STATUS)}')
 
         data = {'project': project, 'status': status}
         content = self._provider.post(path=f'projects/update/{project}', data=data)
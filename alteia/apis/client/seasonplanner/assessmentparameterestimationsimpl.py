@@ -118,7 +118,7 @@ class AssessmentParameterEstimationsImpl:
             data=data
         )
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def start_reporting_on_ape(self, assessment_parameter_estimation: ResourceId,
                                **kwargs) -> Resource:
@@ -141,7 +141,7 @@ class AssessmentParameterEstimationsImpl:
             data=data
         )
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def export_report_entries(self, filter: dict, **kwargs):
         """Export report entries.
@@ -170,11 +170,7 @@ class AssessmentParameterEstimationsImpl:
                 passed as is to the API provider.
 
         """
-        data = kwargs
-
-        for name, value in [('filter', filter or {})]:
-            if value is not None:
-                data.update({name: value})
+        data = {**kwargs, 'filter': filter or {}}
 
         r = self._provider.post(
             path='export-report-entries',
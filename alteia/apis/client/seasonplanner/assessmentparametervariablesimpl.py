@@ -2,7 +2,7 @@ from typing import List, Union
 
 from alteia.apis.provider import SeasonPlannerAssetManagementAPI
 from alteia.core.resources.resource import Resource, ResourcesWithTotal
-from alteia.core.resources.utils import search
+from alteia.core.resources.utils import create_many, search
 from alteia.core.utils.typing import ResourceId, SomeResourceIds, SomeResources
 from alteia.core.utils.utils import get_chunks
 
@@ -37,7 +37,28 @@ class AssessmentParameterVariablesImpl:
             data=data
         )
 
-        return Resource(**content)
+        return Resource.from_dict(content)
+
+    def create_many(self, *, names: List[str], company: ResourceId, **kwargs) -> List[Resource]:
+        """Create several assessment-parameter-variables.
+
+        The assessment-parameter-variables are created concurrently.
+
+        Args:
+            names: assessment-parameter-variable names, one variable
+                is created per name.
+
+            company: Identifier of the company.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the ``create`` method for every variable.
+
+        Returns:
+            Resources: The assessment-parameter-variable resources,
+                in the order of ``names``.
+        """
+        items = [{**kwargs, 'name': name, 'company': company} for name in names]
+        return create_many(self, items=items)
 
     def search(self, *, filter: dict = None, limit: int = None, fields: dict = None,
                page: int = None, sort: dict = None, return_total: bool = False,
@@ -126,26 +147,23 @@ class AssessmentParameterVariablesImpl:
         """
         data = kwargs
         if isinstance(assessment_parameter_variable, list):
-            results = []
             ids_chunks = get_chunks(
                 assessment_parameter_variable,
                 self._provider.max_per_describe
             )
-            for ids_chunk in ids_chunks:
-                data['assessment_parameter_variables'] = ids_chunk
-                descs = self._provider.post(
-                    'describe-assessment-parameter-variables',
-                    data=data
-                )
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-assessment-parameter-variables',
+                [{**data, 'assessment_parameter_variables': ids_chunk}
+                 for ids_chunk in ids_chunks]
+            )
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['assessment_parameter_variable'] = assessment_parameter_variable
             desc = self._provider.post(
                 'describe-assessment-parameter-variable',
                 data=data
             )
-            return Resource(**desc)
+            return Resource.from_dict(desc)
 
     def update(self, *, assessment_parameter_variable: ResourceId, name: str,
                company: str = None, custom_ids: str = None, **kwargs) -> Resource:
@@ -182,7 +200,7 @@ class AssessmentParameterVariablesImpl:
             data=data
         )
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def delete(self, assessment_parameter_variable: ResourceId, **kwargs):
         """Delete a assessment-parameter-variable.
@@ -2,7 +2,7 @@ from typing import List, Union
 
 from alteia.apis.provider import SeasonPlannerAssetManagementAPI
 from alteia.core.resources.resource import Resource, ResourcesWithTotal
-from alteia.core.resources.utils import search
+from alteia.core.resources.utils import create_many, search
 from alteia.core.utils.typing import ResourceId, SomeResourceIds, SomeResources
 from alteia.core.utils.utils import get_chunks
 
@@ -34,7 +34,26 @@ class CropsImpl:
 
         content = self._provider.post(path='create-crop', data=data)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
+
+    def create_many(self, *, names: List[str], company: ResourceId, **kwargs) -> List[Resource]:
+        """Create several crops.
+
+        The crops are created concurrently.
+
+        Args:
+            names: crop names, one crop is created per name.
+
+            company: Identifier of the company.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the ``create`` method for every crop.
+
+        Returns:
+            Resources: The crop resources, in the order of ``names``.
+        """
+        items = [{**kwargs, 'name': name, 'company': company} for name in names]
+        return create_many(self, items=items)
 
     def search(self, *, filter: dict = None, limit: int = None, fields: dict = None,
                page: int = None, sort: dict = None, return_total: bool = False,
@@ -119,17 +138,14 @@ class CropsImpl:
         """
         data = kwargs
         if isinstance(crop, list):
-            results = []
             ids_chunks = get_chunks(crop, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['crops'] = ids_chunk
-                descs = self._provider.post('describe-crops', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            descs_chunks = self._provider.post_many(
+                'describe-crops', [{**data, 'crops': ids_chunk} for ids_chunk in ids_chunks])
+            return [Resource.from_dict(desc) for descs in descs_chunks for desc in descs]
         else:
             data['crop'] = crop
             desc = self._provider.post('describe-crop', data=data)
-            return Resource(**desc)
+            return Resource.from_dict(desc)
 
     def update(self, *, crop: ResourceId, name: str,
                company: str = None, **kwargs) -> Resource:
@@ -159,7 +175,7 @@ class CropsImpl:
 
         content = self._provider.post(path='update-crop', data=data)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def delete(self, crop: ResourceId, **kwargs):
         """Delete a crop.
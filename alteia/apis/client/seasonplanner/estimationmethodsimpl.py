@@ -1,16 +1,26 @@
-from typing import List, Union
+import functools
+from typing import Generator, List, Union
 
 from alteia.apis.provider import SeasonPlannerAssetManagementAPI
+from alteia.core.errors import ResponseError
 from alteia.core.resources.resource import Resource, ResourcesWithTotal
-from alteia.core.resources.utils import search
+from alteia.core.resources.utils import (copy_resource, describe_cache_key,
+                                         describe_iter, describe_many_async,
+                                         describe_many_cached, search,
+                                         search_generator)
 from alteia.core.utils.typing import ResourceId, SomeResourceIds, SomeResources
-from alteia.core.utils.utils import get_chunks
+from alteia.core.utils.utils import get_running_loop
+
+_CREATE_OPTIONAL_PARAMS = ('description', 'status', 'analytic', 'growth_stages')
+_UPDATE_OPTIONAL_PARAMS = ('name', 'description', 'status', 'companies',
+                           'input_data_requirements', 'analytic', 'growth_stages')
 
 
 class EstimationMethodsImpl:
     def __init__(self, season_planner_asset_management_api: SeasonPlannerAssetManagementAPI,
                  **kwargs):
         self._provider = season_planner_asset_management_api
+        self._describe_cache = self._provider.describe_cache('estimation_methods')
 
     def create(self, *, name: str, companies: ResourceId, input_data_requirements: dict,
                crops: list, description: str = None, status: str = None, analytic: dict = None,
@@ -94,24 +104,21 @@ class EstimationMethodsImpl:
         Returns:
             Resource: A estimation-method resource.
         """
-        data = kwargs
-        data.update({
+        data = {
+            **kwargs,
             'name': name,
             'companies': companies,
             'input_data_requirements': input_data_requirements,
-            'crops': crops
-        })
-
-        for param_name, param_value in (('description', description),
-                                        ('status', status),
-                                        ('analytic', analytic),
-                                        ('growth_stages', growth_stages)):
-            if param_value is not None:
-                data[param_name] = param_value
+            'crops': crops,
+            **{param_name: param_value
+               for param_name, param_value in zip(_CREATE_OPTIONAL_PARAMS,
+                                                  (description, status, analytic, growth_stages))
+               if param_value is not None}
+        }
 
         content = self._provider.post(path='create-estimation-method', data=data)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def search(self, *, filter: dict = None, limit: int = None, fields: dict = None,
                page: int = None, sort: dict = None, return_total: bool = False,
@@ -180,9 +187,47 @@ class EstimationMethodsImpl:
             **kwargs
         )
 
+    def search_generator(self, *, filter: dict = None, limit: int = 50,
+                         page: int = None, prefetch: bool = False,
+                         **kwargs) -> Generator[Resource, None, None]:
+        """Return a generator to search through estimation-methods.
+
+        The generator allows the user not to care about the pagination of
+        results, while being memory-effective.
+
+        Found estimation-methods are sorted chronologically in order to
+        allow new resources to be found during the search.
+
+        Args:
+            page: Optional page number to start the search at (default is 0).
+
+            filter: Search filter dictionary.
+
+            limit: Optional maximum number of results by search
+                request (default to 50).
+
+            prefetch: Optional. If ``True``, the next page is requested in
+                the background while the estimation-methods of the current
+                page are yielded (default to ``False``).
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            A generator yielding found estimation-methods.
+
+        """
+        return search_generator(self, first_page=0, filter=filter, limit=limit,
+                                page=page, prefetch=prefetch, **kwargs)
+
     def describe(self, estimation_method: SomeResourceIds, **kwargs) -> SomeResources:
         """Describe an estimation-methods or a list of estimation-methodss.
 
+        When the ``describe_cache_ttl`` connection setting is set,
+        descriptions are cached for that many seconds, the
+        cached descriptions of an estimation-method being dropped when it
+        is updated or deleted.
+
         Args:
             estimation_method: Identifier of the estimation-methods to describe, or list of
                 such identifiers.
@@ -195,19 +240,93 @@ class EstimationMethodsImpl:
                       a list of estimation-methodss descriptions.
 
         """
-        data = kwargs
         if isinstance(estimation_method, list):
-            results = []
-            ids_chunks = get_chunks(estimation_method, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['estimation_methods'] = ids_chunk
-                descs = self._provider.post('describe-estimation-methods', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            return self._describe_many(estimation_method, **kwargs)
+        return self._describe_one(estimation_method, **kwargs)
+
+    def _describe_one(self, estimation_method: ResourceId, **kwargs) -> Resource:
+        if not self._describe_cache.enabled:
+            desc = self._provider.post('describe-estimation-method',
+                                       data={**kwargs, 'estimation_method': estimation_method})
+            return Resource.from_dict(desc)
+
+        cache_key = describe_cache_key(estimation_method, kwargs)
+        resource = self._describe_cache.get(cache_key)
+        if resource is None:
+            desc = self._provider.post('describe-estimation-method',
+                                       data={**kwargs, 'estimation_method': estimation_method})
+            resource = Resource.from_dict(desc)
+            self._describe_cache.set(cache_key, resource)
+        return copy_resource(resource)
+
+    def _describe_many(self, estimation_methods: List[ResourceId], **kwargs) -> List[Resource]:
+        if not estimation_methods:
+            return []
+        if len(estimation_methods) == 1:
+            try:
+                return [self._describe_one(estimation_methods[0], **kwargs)]
+            except ResponseError as e:
+                # Unknown resources are left out, like with the list route
+                if e.status == 404:
+                    return []
+                raise
+        return describe_many_cached(self, self._describe_cache, url='describe-estimation-methods',
+                                    ids_param='estimation_methods', ids=estimation_methods, **kwargs)
+
+    def describe_iter(self, estimation_method: List[ResourceId], **kwargs) -> Generator[Resource, None, None]:
+        """Return a generator describing a list of estimation-methods.
+
+        Unlike ``describe``, the descriptions are requested chunk by
+        chunk, as the iteration goes on.
+
+        Args:
+            estimation_method: Identifiers of the estimation-methods to describe.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            A generator yielding the estimation-methods descriptions.
+
+        Examples:
+            >>> first_match = next(r for r in sdk.estimation_methods.describe_iter(ids)
+            ...                    if r.name == 'name')
+
+        """
+        return describe_iter(self, url='describe-estimation-methods',
+                             ids_param='estimation_methods', ids=estimation_method, **kwargs)
+
+    async def describe_async(self, estimation_method: SomeResourceIds, **kwargs) -> SomeResources:
+        """Describe an estimation-method or a list of estimation-methods without blocking the event loop.
+
+        Coroutine version of ``describe``, the chunks of a list of
+        identifiers being described concurrently.
+
+        Args:
+            estimation_method: Identifier of the estimation-method to describe, or list of
+                such identifiers.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            Resource: The estimation-method description or
+                      a list of estimation-methods descriptions.
+
+        Examples:
+            >>> descs = asyncio.run(sdk.estimation_methods.describe_async(ids))
+
+        """
+        if isinstance(estimation_method, list):
+            return await describe_many_async(self, url='describe-estimation-methods',
+                                             ids_param='estimation_methods',
+                                             ids=estimation_method, **kwargs)
         else:
-            data['estimation_method'] = estimation_method
-            desc = self._provider.post('describe-estimation-method', data=data)
-            return Resource(**desc)
+            loop = get_running_loop()
+            data = {**kwargs, 'estimation_method': estimation_method}
+            desc = await loop.run_in_executor(None, functools.partial(
+                self._provider.post, 'describe-estimation-method', data=data))
+            return Resource.from_dict(desc)
 
     def update(self, *, estimation_method: ResourceId, crops: list,
                name: str = None, description: str = None, status: str = None,
@@ -291,25 +410,22 @@ class EstimationMethodsImpl:
         Returns:
             Resource: A estimation-method resource updated.
         """
-        data = kwargs
-        data.update({
+        data = {
+            **kwargs,
             'estimation_method': estimation_method,
-            'crops': crops
-        })
-
-        for param_name, param_value in (('name', name),
-                                        ('description', description),
-                                        ('status', status),
-                                        ('companies', companies),
-                                        ('input_data_requirements', input_data_requirements),
-                                        ('analytic', analytic),
-                                        ('growth_stages', growth_stages)):
-            if param_value is not None:
-                data[param_name] = param_value
+            'crops': crops,
+            **{param_name: param_value
+               for param_name, param_value in zip(_UPDATE_OPTIONAL_PARAMS,
+                                                  (name, description, status, companies,
+                                                   input_data_requirements, analytic,
+                                                   growth_stages))
+               if param_value is not None}
+        }
 
         content = self._provider.post(path='update-estimation-method', data=data)
+        self._describe_cache.invalidate(estimation_method)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def delete(self, estimation_method: ResourceId, **kwargs):
         """Delete an estimation-method.
@@ -319,10 +435,10 @@ class EstimationMethodsImpl:
 
         """
 
-        data = kwargs
-        data['estimation_method'] = estimation_method
+        data = {**kwargs, 'estimation_method': estimation_method}
 
         self._provider.post('delete-estimation-method', data=data)
+        self._describe_cache.invalidate(estimation_method)
 
     def list_deliverables_definitions(self, *, sensor_type: str, task_purpose: str = "mapping",
                                       **kwargs) -> List[dict]:
@@ -338,13 +454,10 @@ class EstimationMethodsImpl:
 
         """
 
-        data = kwargs
-        data['sensor_type'] = sensor_type
-
-        for param_name, param_value in (('task_purpose', task_purpose),):
-            if param_value is not None:
-                data[param_name] = param_value
+        data = {**kwargs, 'sensor_type': sensor_type}
+        if task_purpose is not None:
+            data['task_purpose'] = task_purpose
 
         content = self._provider.post(path='list-deliverable-definitions', data=data)
 
-        return [c for c in content]
+        return content if isinstance(content, list) else list(content)
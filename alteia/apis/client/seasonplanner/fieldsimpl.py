@@ -1,16 +1,25 @@
-from typing import List, Union
+import functools
+from typing import Generator, List, Union
 
 from alteia.apis.provider import SeasonPlannerAssetManagementAPI
+from alteia.core.errors import ResponseError
 from alteia.core.resources.resource import Resource, ResourcesWithTotal
-from alteia.core.resources.utils import search
+from alteia.core.resources.utils import (copy_resource, describe_cache_key,
+                                         describe_iter, describe_many_async,
+                                         describe_many_cached, search,
+                                         search_generator)
 from alteia.core.utils.typing import ResourceId, SomeResourceIds, SomeResources
-from alteia.core.utils.utils import get_chunks
+from alteia.core.utils.utils import get_running_loop
+
+_CREATE_OPTIONAL_PARAMS = ('description',)
+_UPDATE_OPTIONAL_PARAMS = ('company', 'description')
 
 
 class FieldsImpl:
     def __init__(self, season_planner_asset_management_api: SeasonPlannerAssetManagementAPI,
                  **kwargs):
         self._provider = season_planner_asset_management_api
+        self._describe_cache = self._provider.describe_cache('fields')
 
     def create(self, *, company: ResourceId, project: ResourceId, name: str,
                description: str = None, **kwargs) -> Resource:
@@ -31,19 +40,19 @@ class FieldsImpl:
         Returns:
             Resource: A field resource.
         """
-        data = kwargs
-        data.update({
+        data = {
+            **kwargs,
             'company': company,
             'project': project,
-            'name': name
-        })
-
-        if description is not None:
-            data['description'] = description
+            'name': name,
+            **{param_name: param_value
+               for param_name, param_value in zip(_CREATE_OPTIONAL_PARAMS, (description,))
+               if param_value is not None}
+        }
 
         content = self._provider.post(path='create-field', data=data)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def search(self, *, filter: dict = None, limit: int = None, fields: dict = None,
                page: int = None, sort: dict = None, return_total: bool = False,
@@ -112,9 +121,117 @@ class FieldsImpl:
             **kwargs
         )
 
+    def search_generator(self, *, filter: dict = None, limit: int = 50,
+                         page: int = None, prefetch: bool = False,
+                         **kwargs) -> Generator[Resource, None, None]:
+        """Return a generator to search through fields.
+
+        The generator allows the user not to care about the pagination of
+        results, while being memory-effective.
+
+        Found fields are sorted chronologically in order to allow
+        new resources to be found during the search.
+
+        Args:
+            page: Optional page number to start the search at (default is 0).
+
+            filter: Search filter dictionary.
+
+            limit: Optional maximum number of results by search
+                request (default to 50).
+
+            prefetch: Optional. If ``True``, the next page is requested in
+                the background while the fields of the current page are
+                yielded (default to ``False``).
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            A generator yielding found fields.
+
+        """
+        return search_generator(self, first_page=0, filter=filter, limit=limit,
+                                page=page, prefetch=prefetch, **kwargs)
+
     def describe(self, field: SomeResourceIds, **kwargs) -> SomeResources:
         """Describe a field or a list of fields.
 
+        When the ``describe_cache_ttl`` connection setting is set,
+        descriptions are cached for that many seconds, the
+        cached descriptions of a field being dropped when it is updated
+        or deleted.
+
+        Args:
+            field: Identifier of the field to describe, or list of
+                such identifiers.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            Resource: The field description or a list of fields descriptions.
+
+        """
+        if isinstance(field, list):
+            return self._describe_many(field, **kwargs)
+        return self._describe_one(field, **kwargs)
+
+    def _describe_one(self, field: ResourceId, **kwargs) -> Resource:
+        if not self._describe_cache.enabled:
+            desc = self._provider.post('describe-field', data={**kwargs, 'field': field})
+            return Resource.from_dict(desc)
+
+        cache_key = describe_cache_key(field, kwargs)
+        resource = self._describe_cache.get(cache_key)
+        if resource is None:
+            desc = self._provider.post('describe-field', data={**kwargs, 'field': field})
+            resource = Resource.from_dict(desc)
+            self._describe_cache.set(cache_key, resource)
+        return copy_resource(resource)
+
+    def _describe_many(self, fields: List[ResourceId], **kwargs) -> List[Resource]:
+        if not fields:
+            return []
+        if len(fields) == 1:
+            try:
+                return [self._describe_one(fields[0], **kwargs)]
+            except ResponseError as e:
+                # Unknown resources are left out, like with the list route
+                if e.status == 404:
+                    return []
+                raise
+        return describe_many_cached(self, self._describe_cache, url='describe-fields',
+                                    ids_param='fields', ids=fields, **kwargs)
+
+    def describe_iter(self, field: List[ResourceId], **kwargs) -> Generator[Resource, None, None]:
+        """Return a generator describing a list of fields.
+
+        Unlike ``describe``, the descriptions are requested chunk by
+        chunk, as the iteration goes on.
+
+        Args:
+            field: Identifiers of the fields to describe.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            A generator yielding the fields descriptions.
+
+        Examples:
+            >>> first_match = next(r for r in sdk.fields.describe_iter(ids)
+            ...                    if r.name == 'name')
+
+        """
+        return describe_iter(self, url='describe-fields', ids_param='fields', ids=field, **kwargs)
+
+    async def describe_async(self, field: SomeResourceIds, **kwargs) -> SomeResources:
+        """Describe a field or a list of fields without blocking the event loop.
+
+        Coroutine version of ``describe``, the chunks of a list of
+        identifiers being described concurrently.
+
         Args:
             field: Identifier of the field to describe, or list of
                 such identifiers.
@@ -125,20 +242,19 @@ class FieldsImpl:
         Returns:
             Resource: The field description or a list of fields descriptions.
 
+        Examples:
+            >>> descs = asyncio.run(sdk.fields.describe_async(ids))
+
         """
-        data = kwargs
         if isinstance(field, list):
-            results = []
-            ids_chunks = get_chunks(field, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['fields'] = ids_chunk
-                descs = self._provider.post('describe-fields', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            return await describe_many_async(self, url='describe-fields', ids_param='fields',
+                                             ids=field, **kwargs)
         else:
-            data['field'] = field
-            desc = self._provider.post('describe-field', data=data)
-            return Resource(**desc)
+            loop = get_running_loop()
+            data = {**kwargs, 'field': field}
+            desc = await loop.run_in_executor(None, functools.partial(
+                self._provider.post, 'describe-field', data=data))
+            return Resource.from_dict(desc)
 
     def update(self, *, field: ResourceId, project: ResourceId, name: str,
                company: str = None, description: str = None, **kwargs) -> Resource:
@@ -161,21 +277,20 @@ class FieldsImpl:
         Returns:
             Resource: A field resource updated.
         """
-        data = kwargs
-        data.update({
+        data = {
+            **kwargs,
             'field': field,
             'project': project,
-            'name': name
-        })
-
-        for param_name, param_value in (('company', company),
-                                        ('description', description)):
-            if param_value is not None:
-                data[param_name] = param_value
+            'name': name,
+            **{param_name: param_value
+               for param_name, param_value in zip(_UPDATE_OPTIONAL_PARAMS, (company, description))
+               if param_value is not None}
+        }
 
         content = self._provider.post(path='update-field', data=data)
+        self._describe_cache.invalidate(field)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def delete(self, field: ResourceId, **kwargs):
         """Delete a field.
@@ -185,7 +300,7 @@ class FieldsImpl:
 
         """
 
-        data = kwargs
-        data['field'] = field
+        data = {**kwargs, 'field': field}
 
         self._provider.post('delete-field', data=data)
+        self._describe_cache.invalidate(field)
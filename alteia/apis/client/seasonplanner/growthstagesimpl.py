@@ -1,16 +1,23 @@
-from typing import List, Union
+import functools
+from typing import Generator, List, Union
 
 from alteia.apis.provider import SeasonPlannerAssetManagementAPI
+from alteia.core.errors import ResponseError
 from alteia.core.resources.resource import Resource, ResourcesWithTotal
-from alteia.core.resources.utils import search
+from alteia.core.resources.utils import (copy_resource, describe_cache_key,
+                                         describe_iter, describe_many_async,
+                                         describe_many_cached, search)
 from alteia.core.utils.typing import ResourceId, SomeResourceIds, SomeResources
-from alteia.core.utils.utils import get_chunks
+from alteia.core.utils.utils import get_running_loop
+
+_UPDATE_OPTIONAL_PARAMS = ('company',)
 
 
 class GrowthStagesImpl:
     def __init__(self, season_planner_asset_management_api: SeasonPlannerAssetManagementAPI,
                  **kwargs):
         self._provider = season_planner_asset_management_api
+        self._describe_cache = self._provider.describe_cache('growth_stages')
 
     def create(self, *, company: ResourceId, name: str, **kwargs) -> Resource:
         """Create a growth-stage.
@@ -26,15 +33,15 @@ class GrowthStagesImpl:
         Returns:
             Resource: A growth-stage resource.
         """
-        data = kwargs
-        data.update({
+        data = {
+            **kwargs,
             'company': company,
             'name': name
-        })
+        }
 
         content = self._provider.post(path='create-growth-stage', data=data)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def search(self, *, filter: dict = None, limit: int = None, fields: dict = None,
                page: int = None, sort: dict = None, return_total: bool = False,
@@ -105,6 +112,81 @@ class GrowthStagesImpl:
     def describe(self, growth_stage: SomeResourceIds, **kwargs) -> SomeResources:
         """Describe a growth-stage or a list of growth-stages.
 
+        When the ``describe_cache_ttl`` connection setting is set,
+        descriptions are cached for that many seconds, the
+        cached descriptions of a growth-stage being dropped when it is updated
+        or deleted.
+
+        Args:
+            growth_stage: Identifier of the growth-stage to describe, or list of
+                such identifiers.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            Resource: The growth-stage description or a list of growth-stages descriptions.
+
+        """
+        if isinstance(growth_stage, list):
+            return self._describe_many(growth_stage, **kwargs)
+        return self._describe_one(growth_stage, **kwargs)
+
+    def _describe_one(self, growth_stage: ResourceId, **kwargs) -> Resource:
+        if not self._describe_cache.enabled:
+            desc = self._provider.post('describe-growth-stage', data={**kwargs, 'growth_stage': growth_stage})
+            return Resource.from_dict(desc)
+
+        cache_key = describe_cache_key(growth_stage, kwargs)
+        resource = self._describe_cache.get(cache_key)
+        if resource is None:
+            desc = self._provider.post('describe-growth-stage', data={**kwargs, 'growth_stage': growth_stage})
+            resource = Resource.from_dict(desc)
+            self._describe_cache.set(cache_key, resource)
+        return copy_resource(resource)
+
+    def _describe_many(self, growth_stages: List[ResourceId], **kwargs) -> List[Resource]:
+        if not growth_stages:
+            return []
+        if len(growth_stages) == 1:
+            try:
+                return [self._describe_one(growth_stages[0], **kwargs)]
+            except ResponseError as e:
+                # Unknown resources are left out, like with the list route
+                if e.status == 404:
+                    return []
+                raise
+        return describe_many_cached(self, self._describe_cache, url='describe-growth-stages',
+                                    ids_param='growth_stages', ids=growth_stages, **kwargs)
+
+    def describe_iter(self, growth_stage: List[ResourceId], **kwargs) -> Generator[Resource, None, None]:
+        """Return a generator describing a list of growth-stages.
+
+        Unlike ``describe``, the descriptions are requested chunk by
+        chunk, as the iteration goes on.
+
+        Args:
+            growth_stage: Identifiers of the growth-stages to describe.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            A generator yielding the growth-stages descriptions.
+
+        Examples:
+            >>> first_match = next(r for r in sdk.growth_stages.describe_iter(ids)
+            ...                    if r.name == 'name')
+
+        """
+        return describe_iter(self, url='describe-growth-stages', ids_param='growth_stages', ids=growth_stage, **kwargs)
+
+    async def describe_async(self, growth_stage: SomeResourceIds, **kwargs) -> SomeResources:
+        """Describe a growth-stage or a list of growth-stages without blocking the event loop.
+
+        Coroutine version of ``describe``, the chunks of a list of
+        identifiers being described concurrently.
+
         Args:
             growth_stage: Identifier of the growth-stage to describe, or list of
                 such identifiers.
@@ -115,20 +197,19 @@ class GrowthStagesImpl:
         Returns:
             Resource: The growth-stage description or a list of growth-stages descriptions.
 
+        Examples:
+            >>> descs = asyncio.run(sdk.growth_stages.describe_async(ids))
+
         """
-        data = kwargs
         if isinstance(growth_stage, list):
-            results = []
-            ids_chunks = get_chunks(growth_stage, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['growth_stages'] = ids_chunk
-                descs = self._provider.post('describe-growth-stages', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            return await describe_many_async(self, url='describe-growth-stages', ids_param='growth_stages',
+                                             ids=growth_stage, **kwargs)
         else:
-            data['growth_stage'] = growth_stage
-            desc = self._provider.post('describe-growth-stage', data=data)
-            return Resource(**desc)
+            loop = get_running_loop()
+            data = {**kwargs, 'growth_stage': growth_stage}
+            desc = await loop.run_in_executor(None, functools.partial(
+                self._provider.post, 'describe-growth-stage', data=data))
+            return Resource.from_dict(desc)
 
     def update(self, *, growth_stage: ResourceId, name: str,
                company: str = None, **kwargs) -> Resource:
@@ -147,18 +228,19 @@ class GrowthStagesImpl:
         Returns:
             Resource: A growth-stage resource updated.
         """
-        data = kwargs
-        data.update({
+        data = {
+            **kwargs,
             'growth_stage': growth_stage,
-            'name': name
-        })
-
-        if company is not None:
-            data['company'] = company
+            'name': name,
+            **{param_name: param_value
+               for param_name, param_value in zip(_UPDATE_OPTIONAL_PARAMS, (company,))
+               if param_value is not None}
+        }
 
         content = self._provider.post(path='update-growth-stage', data=data)
+        self._describe_cache.invalidate(growth_stage)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def delete(self, growth_stage: ResourceId, **kwargs):
         """Delete a growth-stage.
@@ -168,7 +250,7 @@ class GrowthStagesImpl:
 
         """
 
-        data = kwargs
-        data['growth_stage'] = growth_stage
+        data = {**kwargs, 'growth_stage': growth_stage}
 
         self._provider.post('delete-growth-stage', data=data)
+        self._describe_cache.invalidate(growth_stage)
@@ -1,16 +1,26 @@
-from typing import List, Union
+import functools
+from typing import Generator, List, Union
 
 from alteia.apis.provider import SeasonPlannerTrialManagementAPI
+from alteia.core.errors import ResponseError
 from alteia.core.resources.resource import Resource, ResourcesWithTotal
-from alteia.core.resources.utils import search
+from alteia.core.resources.utils import (copy_resource, describe_cache_key,
+                                         describe_iter, describe_many_async,
+                                         describe_many_cached, search)
 from alteia.core.utils.typing import ResourceId, SomeResourceIds, SomeResources
-from alteia.core.utils.utils import get_chunks
+from alteia.core.utils.utils import get_running_loop
+
+_MISSION_OPTIONAL_PARAMS = ('start_date', 'end_date', 'description',
+                            'estimation_methods', 'growth_stages_range')
 
 
 class SeasonPlannerMissionsImpl:
     def __init__(self, season_planner_trial_management_api: SeasonPlannerTrialManagementAPI,
                  **kwargs):
         self._provider = season_planner_trial_management_api
+        self._describe_cache = self._provider.describe_cache('missions')
+        # Trials descriptions include their missions
+        self._trials_describe_cache = self._provider.describe_cache('trials')
 
     def add_mission_to_trial(self, *, trial: ResourceId, name: str, start_date: str = None,
                              end_date: str = None, description: str = None,
@@ -42,21 +52,21 @@ class SeasonPlannerMissionsImpl:
         Returns:
             Resource: A trial resource.
         """
-        data = kwargs
-        data['trial'] = trial
-        data['name'] = name
-
-        for param_name, param_value in (('start_date', start_date),
-                                        ('end_date', end_date),
-                                        ('description', description),
-                                        ('estimation_methods', estimation_methods),
-                                        ('growth_stages_range', growth_stages_range),):
-            if param_value is not None:
-                data[param_name] = param_value
+        data = {
+            **kwargs,
+            'trial': trial,
+            'name': name,
+            **{param_name: param_value
+               for param_name, param_value in zip(_MISSION_OPTIONAL_PARAMS,
+                                                  (start_date, end_date, description,
+                                                   estimation_methods, growth_stages_range))
+               if param_value is not None}
+        }
 
         content = self._provider.post(path='add-mission-to-trial', data=data)
+        self._trials_describe_cache.invalidate(trial)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def search(self, *, filter: dict = None, limit: int = None,
                page: int = None, sort: dict = None, return_total: bool = False,
@@ -124,6 +134,11 @@ class SeasonPlannerMissionsImpl:
     def describe(self, mission: SomeResourceIds, **kwargs) -> SomeResources:
         """Describe a mission.
 
+        When the ``describe_cache_ttl`` connection setting is set,
+        descriptions are cached for that many seconds, the
+        cached descriptions of a mission being dropped when it is updated
+        or deleted.
+
         Args:
             mission: Identifier of the mission to describe, or list of
                 such identifiers.
@@ -133,19 +148,88 @@ class SeasonPlannerMissionsImpl:
                 or a list of mission descriptions.
 
         """
-        data = kwargs
         if isinstance(mission, list):
-            results = []
-            ids_chunks = get_chunks(mission, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['missions'] = ids_chunk
-                descs = self._provider.post('describe-missions', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            return self._describe_many(mission, **kwargs)
+        return self._describe_one(mission, **kwargs)
+
+    def _describe_one(self, mission: ResourceId, **kwargs) -> Resource:
+        if not self._describe_cache.enabled:
+            desc = self._provider.post('describe-mission', data={**kwargs, 'mission': mission})
+            return Resource.from_dict(desc)
+
+        cache_key = describe_cache_key(mission, kwargs)
+        resource = self._describe_cache.get(cache_key)
+        if resource is None:
+            desc = self._provider.post('describe-mission', data={**kwargs, 'mission': mission})
+            resource = Resource.from_dict(desc)
+            self._describe_cache.set(cache_key, resource)
+        return copy_resource(resource)
+
+    def _describe_many(self, missions: List[ResourceId], **kwargs) -> List[Resource]:
+        if not missions:
+            return []
+        if len(missions) == 1:
+            try:
+                return [self._describe_one(missions[0], **kwargs)]
+            except ResponseError as e:
+                # Unknown resources are left out, like with the list route
+                if e.status == 404:
+                    return []
+                raise
+        return describe_many_cached(self, self._describe_cache, url='describe-missions',
+                                    ids_param='missions', ids=missions, **kwargs)
+
+    def describe_iter(self, mission: List[ResourceId], **kwargs) -> Generator[Resource, None, None]:
+        """Return a generator describing a list of missions.
+
+        Unlike ``describe``, the descriptions are requested chunk by
+        chunk, as the iteration goes on.
+
+        Args:
+            mission: Identifiers of the missions to describe.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            A generator yielding the missions descriptions.
+
+        Examples:
+            >>> first_match = next(r for r in sdk.season_planner_missions.describe_iter(ids)
+            ...                    if r.name == 'name')
+
+        """
+        return describe_iter(self, url='describe-missions', ids_param='missions', ids=mission, **kwargs)
+
+    async def describe_async(self, mission: SomeResourceIds, **kwargs) -> SomeResources:
+        """Describe a mission or a list of missions without blocking the event loop.
+
+        Coroutine version of ``describe``, the chunks of a list of
+        identifiers being described concurrently.
+
+        Args:
+            mission: Identifier of the mission to describe, or list of
+                such identifiers.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            Resource: The mission description or a list of missions descriptions.
+
+        Examples:
+            >>> descs = asyncio.run(sdk.season_planner_missions.describe_async(ids))
+
+        """
+        if isinstance(mission, list):
+            return await describe_many_async(self, url='describe-missions', ids_param='missions',
+                                             ids=mission, **kwargs)
         else:
-            data['mission'] = mission
-            desc = self._provider.post('describe-mission', data=data)
-            return Resource(**desc)
+            loop = get_running_loop()
+            data = {**kwargs, 'mission': mission}
+            desc = await loop.run_in_executor(None, functools.partial(
+                self._provider.post, 'describe-mission', data=data))
+            return Resource.from_dict(desc)
 
     def update_mission(self, *, mission: ResourceId, name: str, start_date: str = None,
                        end_date: str = None, description: str = None,
@@ -175,21 +259,23 @@ class SeasonPlannerMissionsImpl:
         Returns:
             Resource: A mission resource.
         """
-        data = kwargs
-        data['mission'] = mission
-        data['name'] = name
-
-        for param_name, param_value in (('start_date', start_date),
-                                        ('end_date', end_date),
-                                        ('description', description),
-                                        ('estimation_methods', estimation_methods),
-                                        ('growth_stages_range', growth_stages_range),):
-            if param_value is not None:
-                data[param_name] = param_value
+        data = {
+            **kwargs,
+            'mission': mission,
+            'name': name,
+            **{param_name: param_value
+               for param_name, param_value in zip(_MISSION_OPTIONAL_PARAMS,
+                                                  (start_date, end_date, description,
+                                                   estimation_methods, growth_stages_range))
+               if param_value is not None}
+        }
 
         content = self._provider.post(path='update-mission', data=data)
+        self._describe_cache.invalidate(mission)
+        # The trial of the mission is unknown
+        self._trials_describe_cache.clear()
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def delete(self, mission: ResourceId, **kwargs):
         """Delete a mission.
@@ -199,7 +285,9 @@ class SeasonPlannerMissionsImpl:
 
         """
 
-        data = kwargs
-        data['mission'] = mission
+        data = {**kwargs, 'mission': mission}
 
         self._provider.post('delete-mission', data=data)
+        self._describe_cache.invalidate(mission)
+        # The trial of the mission is unknown
+        self._trials_describe_cache.clear()
@@ -1,16 +1,25 @@
+import functools
 from typing import Generator, List, Union
 
 from alteia.apis.provider import SeasonPlannerTrialManagementAPI
+from alteia.core.errors import ResponseError
 from alteia.core.resources.resource import Resource, ResourcesWithTotal
-from alteia.core.resources.utils import search, search_generator
+from alteia.core.resources.utils import (copy_resource, describe_cache_key,
+                                         describe_iter, describe_many_async,
+                                         describe_many_cached, search,
+                                         search_generator)
 from alteia.core.utils.typing import ResourceId, SomeResourceIds, SomeResources
-from alteia.core.utils.utils import get_chunks
+from alteia.core.utils.utils import get_running_loop
+
+_CREATE_OPTIONAL_PARAMS = ('comment', 'season', 'location', 'missions', 'links', 'custom_id')
+_UPDATE_OPTIONAL_PARAMS = ('name', 'comment', 'season', 'location', 'links', 'custom_id')
 
 
 class TrialsImpl:
     def __init__(self, season_planner_trial_management_api: SeasonPlannerTrialManagementAPI,
                  **kwargs):
         self._provider = season_planner_trial_management_api
+        self._describe_cache = self._provider.describe_cache('trials')
 
     def create(self, *, field: ResourceId, name: str, crop: ResourceId, comment: str = None,
                season: str = None, location: dict = None, missions: List = None, links: List = None,
@@ -100,25 +109,21 @@ class TrialsImpl:
         Returns:
             Resource: A trial resource.
         """
-        data = kwargs
-        data.update({
+        data = {
+            **kwargs,
             'field': field,
             'name': name,
             'crop': crop,
-        })
-
-        for param_name, param_value in (('comment', comment),
-                                        ('season', season),
-                                        ('location', location),
-                                        ('missions', missions),
-                                        ('links', links),
-                                        ('custom_id', custom_id),):
-            if param_value is not None:
-                data[param_name] = param_value
+            **{param_name: param_value
+               for param_name, param_value in zip(_CREATE_OPTIONAL_PARAMS,
+                                                  (comment, season, location, missions,
+                                                   links, custom_id))
+               if param_value is not None}
+        }
 
         content = self._provider.post(path='create-trial', data=data)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def search(self, *, filter: dict = None, limit: int = None,
                page: int = None, sort: dict = None, return_total: bool = False,
@@ -190,7 +195,7 @@ class TrialsImpl:
         )
 
     def search_generator(self, *, filter: dict = None, limit: int = 50,
-                         page: int = None,
+                         page: int = None, prefetch: bool = False,
                          **kwargs) -> Generator[Resource, None, None]:
         """Return a generator to search through trials.
 
@@ -198,7 +203,9 @@ class TrialsImpl:
         results, while being memory-effective.
 
         Found trials are sorted chronologically in order to allow
-        new resources to be found during the search.
+        new resources to be found during the search. They are the
+        descriptions returned by the search requests, there is no need
+        to describe them again.
 
         Args:
             page: Optional page number to start the search at (default is 0).
@@ -208,6 +215,10 @@ class TrialsImpl:
             limit: Optional maximum number of results by search
                 request (default to 50).
 
+            prefetch: Optional. If ``True``, the next page is requested in
+                the background while the trials of the current page are
+                yielded (default to ``False``).
+
             **kwargs: Optional keyword arguments. Those arguments are
                 passed as is to the API provider.
 
@@ -216,11 +227,17 @@ class TrialsImpl:
 
         """
         return search_generator(self, first_page=0, filter=filter, limit=limit,
-                                page=page, **kwargs)
+                                page=page, prefetch=prefetch, **kwargs)
 
     def describe(self, trial: SomeResourceIds, **kwargs) -> SomeResources:
         """Describe a trial.
 
+        When the ``describe_cache_ttl`` connection setting is set,
+        descriptions are cached for that many seconds, the
+        cached descriptions of a trial being dropped when it is updated
+        or deleted, or when one of its missions is added, updated or
+        deleted.
+
         Args:
             trial: Identifier of the trial to describe, or list of
                 such identifiers.
@@ -230,19 +247,88 @@ class TrialsImpl:
                 or a list of trial descriptions.
 
         """
-        data = kwargs
         if isinstance(trial, list):
-            results = []
-            ids_chunks = get_chunks(trial, self._provider.max_per_describe)
-            for ids_chunk in ids_chunks:
-                data['trials'] = ids_chunk
-                descs = self._provider.post('describe-trials', data=data)
-                results += [Resource(**desc) for desc in descs]
-            return results
+            return self._describe_many(trial, **kwargs)
+        return self._describe_one(trial, **kwargs)
+
+    def _describe_one(self, trial: ResourceId, **kwargs) -> Resource:
+        if not self._describe_cache.enabled:
+            desc = self._provider.post('describe-trial', data={**kwargs, 'trial': trial})
+            return Resource.from_dict(desc)
+
+        cache_key = describe_cache_key(trial, kwargs)
+        resource = self._describe_cache.get(cache_key)
+        if resource is None:
+            desc = self._provider.post('describe-trial', data={**kwargs, 'trial': trial})
+            resource = Resource.from_dict(desc)
+            self._describe_cache.set(cache_key, resource)
+        return copy_resource(resource)
+
+    def _describe_many(self, trials: List[ResourceId], **kwargs) -> List[Resource]:
+        if not trials:
+            return []
+        if len(trials) == 1:
+            try:
+                return [self._describe_one(trials[0], **kwargs)]
+            except ResponseError as e:
+                # Unknown resources are left out, like with the list route
+                if e.status == 404:
+                    return []
+                raise
+        return describe_many_cached(self, self._describe_cache, url='describe-trials',
+                                    ids_param='trials', ids=trials, **kwargs)
+
+    def describe_iter(self, trial: List[ResourceId], **kwargs) -> Generator[Resource, None, None]:
+        """Return a generator describing a list of trials.
+
+        Unlike ``describe``, the descriptions are requested chunk by
+        chunk, as the iteration goes on.
+
+        Args:
+            trial: Identifiers of the trials to describe.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            A generator yielding the trials descriptions.
+
+        Examples:
+            >>> first_match = next(r for r in sdk.trials.describe_iter(ids)
+            ...                    if r.name == 'name')
+
+        """
+        return describe_iter(self, url='describe-trials', ids_param='trials', ids=trial, **kwargs)
+
+    async def describe_async(self, trial: SomeResourceIds, **kwargs) -> SomeResources:
+        """Describe a trial or a list of trials without blocking the event loop.
+
+        Coroutine version of ``describe``, the chunks of a list of
+        identifiers being described concurrently.
+
+        Args:
+            trial: Identifier of the trial to describe, or list of
+                such identifiers.
+
+            **kwargs: Optional keyword arguments. Those arguments are
+                passed as is to the API provider.
+
+        Returns:
+            Resource: The trial description or a list of trials descriptions.
+
+        Examples:
+            >>> descs = asyncio.run(sdk.trials.describe_async(ids))
+
+        """
+        if isinstance(trial, list):
+            return await describe_many_async(self, url='describe-trials', ids_param='trials',
+                                             ids=trial, **kwargs)
         else:
-            data['trial'] = trial
-            desc = self._provider.post('describe-trial', data=data)
-            return Resource(**desc)
+            loop = get_running_loop()
+            data = {**kwargs, 'trial': trial}
+            desc = await loop.run_in_executor(None, functools.partial(
+                self._provider.post, 'describe-trial', data=data))
+            return Resource.from_dict(desc)
 
     def delete(self, trial: ResourceId, **kwargs):
         """Delete a trial.
@@ -252,10 +338,10 @@ class TrialsImpl:
 
         """
 
-        data = kwargs
-        data['trial'] = trial
+        data = {**kwargs, 'trial': trial}
 
         self._provider.post('delete-trial', data=data)
+        self._describe_cache.invalidate(trial)
 
     def update(self, trial: ResourceId, field: ResourceId, crop: ResourceId, name: str = None,
                comment: str = None, season: str = None, location: dict = None,
@@ -328,23 +414,22 @@ class TrialsImpl:
         Returns:
             Resource: A trial resource.
         """
-        data = kwargs
-        data['trial'] = trial
-        data['field'] = field
-        data['crop'] = crop
-
-        for param_name, param_value in (('name', name),
-                                        ('comment', comment),
-                                        ('season', season),
-                                        ('location', location),
-                                        ('links', links),
-                                        ('custom_id', custom_id),):
-            if param_value is not None:
-                data[param_name] = param_value
+        data = {
+            **kwargs,
+            'trial': trial,
+            'field': field,
+            'crop': crop,
+            **{param_name: param_value
+               for param_name, param_value in zip(_UPDATE_OPTIONAL_PARAMS,
+                                                  (name, comment, season, location,
+                                                   links, custom_id))
+               if param_value is not None}
+        }
 
         content = self._provider.post(path='update-trial', data=data)
+        self._describe_cache.invalidate(trial)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def set_plots_on_trial(self, *, trial: ResourceId, plots: dict, **kwargs) -> Resource:
         """
@@ -405,13 +490,16 @@ class TrialsImpl:
         Returns:
             Resource: A trial resource.
         """
-        data = kwargs
-        data["trial"] = trial
-        data["plots"] = plots
+        data = {
+            **kwargs,
+            'trial': trial,
+            'plots': plots
+        }
 
         content = self._provider.post(path='set-plots-on-trial', data=data)
+        self._describe_cache.invalidate(trial)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
 
     def set_dtm_dataset_on_trial(self, *, trial: ResourceId, dataset: ResourceId,
                                  **kwargs) -> Resource:
@@ -426,10 +514,13 @@ class TrialsImpl:
         Returns:
             Resource: A trial resource.
         """
-        data = kwargs
-        data["trial"] = trial
-        data["dataset"] = dataset
+        data = {
+            **kwargs,
+            'trial': trial,
+            'dataset': dataset
+        }
 
         content = self._provider.post(path='set-dtm-dataset-on-trial', data=data)
+        self._describe_cache.invalidate(trial)
 
-        return Resource(**content)
+        return Resource.from_dict(content)
@@ -2,13 +2,23 @@
 
 """
 
-import urllib.parse
 from typing import List
+from urllib.parse import quote_plus
 
 from alteia.apis.provider import ProjectManagerAPI
 from alteia.core.errors import ParameterError
 from alteia.core.resources.tags import Tag
-from alteia.core.utils.typing import ResourceId
+from alteia.core.utils.typing import ResourceId, SomeResourceIds
+from alteia.core.utils.utils import concurrent_map
+
+_TAG_TYPES = frozenset({'project', 'annotation', 'flight', 'photo', 'dataset',
+                        'feature', 'gcp', 'task'})
+
+
+def _check_tag_type(type: str):
+    if type not in _TAG_TYPES:
+        raise ParameterError(f'Invalid tag type {type!r}, must be one of: '
+                             f'{", ".join(sorted(_TAG_TYPES))}')
 
 
 class TagsImpl:
@@ -39,6 +49,10 @@ class TagsImpl:
             **kwargs: Optional keyword arguments. Those arguments are
                 passed as is to the API provider.
 
+        Raises:
+            ParameterError: The tag type is invalid, or the target or flight
+                of a photo tag is missing.
+
         Returns:
             Tag: The created tag.
 
@@ -51,6 +65,8 @@ class TagsImpl:
             Tag(_id='5f6155ae8dcb064fcbf4ae35')
 
         """
+        _check_tag_type(type)
+
         data = kwargs
         data.update({'project_id': project,
                      'text': name,
@@ -71,42 +87,35 @@ class TagsImpl:
         return self._convert_uisrv_desc_to_Tag(res['tag'])
 
     def _convert_uisrv_desc_to_Tag(self, desc: dict) -> Tag:
-        """Convert a tag description returned by UI-Services to a Tag object"""
-        # {'Tag_key': 'uisrv_desc_key'}
-        params = {}
+        """Convert a tag description returned by UI-Services to a Tag object.
+
+        The top-level keys of ``desc`` are consumed, its ``target`` is left
+        untouched so that it can be shared between descriptions.
 
-        name = desc.pop('text')
-        project = desc.pop('project_id')
-        creation_date = desc.pop('date')
-        type = desc['target'].pop('type')
-        creation_user = desc['author'].pop('id')
+        """
+        target = desc.pop('target')
+        params = {'name': desc.pop('text'),
+                  'project': desc.pop('project_id'),
+                  'creation_date': desc.pop('date'),
+                  'type': target['type'],
+                  'creation_user': desc.pop('author')['id']}
 
         if desc.get('deleted') is not None:
             params['deletion_date'] = desc.pop('deleted')
-        if desc['target'].get('subId'):
-            params['target'] = desc['target'].pop('subId')
-            params['flight'] = desc['target'].pop('id')
-        elif desc['target'].get('id'):
-            params['target'] = desc['target'].pop('id')
-        desc.pop('target')
 
-        desc.pop('author')
+        sub_id = target.get('subId')
+        if sub_id:
+            params['target'] = sub_id
+            params['flight'] = target['id']
+        elif target.get('id'):
+            params['target'] = target['id']
 
         if desc.get('deleted_by'):
-            params['deletion_user'] = desc['deleted_by'].pop('id')
-            desc.pop('deleted_by')
+            params['deletion_user'] = desc.pop('deleted_by')['id']
 
         params.update(desc)  # Save remaining properties (should be empty)
 
-        return Tag(
-            id=desc['_id'],
-            name=name,
-            project=project,
-            creation_date=creation_date,
-            type=type,
-            creation_user=creation_user,
-            **params
-        )
+        return Tag(id=desc['_id'], **params)
 
     def search(self, *, project: ResourceId, type: str = None,
                target: ResourceId = None, flight: ResourceId = None,
@@ -131,6 +140,9 @@ class TagsImpl:
             **kwargs: Optional keyword arguments. Those arguments are
                 passed as is to the API provider.
 
+        Raises:
+            ParameterError: The tag type is invalid.
+
         Returns:
             Resources: The found tags.
 
@@ -143,6 +155,7 @@ class TagsImpl:
         query['project_id'] = project
 
         if type:
+            _check_tag_type(type)
             query['target_type'] = type
 
         if flight:
@@ -154,31 +167,35 @@ class TagsImpl:
         elif target:
             query['target_id'] = target
 
-        query_str = urllib.parse.urlencode(query)
+        # Equivalent to urlencode() for the str and number values used here
+        query_str = '&'.join(f'{key}={quote_plus(str(value))}'
+                             for key, value in query.items())
         path = f'tags?{query_str}'
 
-        desc = self._provider.get(path)
-
         found_tags = []
-        for group in desc.get('tagGroups'):
-            for tag in group.get('tags'):
-                tag.update({'project_id': project})
-                tag.update({'target': group.get('_id').copy()})
+        for group in self._provider.get_iter(path, key='tagGroups'):
+            target = group.get('_id')
+            for tag in group.get('tags', ()):
+                tag['project_id'] = project
+                tag['target'] = target
                 found_tags.append(self._convert_uisrv_desc_to_Tag(desc=tag))
         return found_tags
 
-    def delete(self, tag: ResourceId) -> None:
-        """Delete a tag.
+    def delete(self, tag: SomeResourceIds) -> None:
+        """Delete a tag or multiple tags.
 
-        Args:
-            tag: Identifier of the tag to delete.
+        The tags API has no bulk deletion route, the deletion requests
+        of multiple tags are thus sent concurrently.
 
-            **kwargs: Optional keyword arguments. Those arguments are
-                passed as is to the API provider.
+        Args:
+            tag: Identifier of the tag to delete, or list of such
+                identifiers.
 
         Examples:
             >>> sdk.tags.delete('5d63cf972fb3880011e57f22')
 
         """
+        if not isinstance(tag, list):
+            tag = [tag]
 
-        self._provider.delete(f'tags/{tag}')
+        concurrent_map(lambda tag_id: self._provider.delete(f'tags/{tag_id}'), tag)
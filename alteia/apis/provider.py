@@ -1,30 +1,93 @@
-import json
-from typing import Any, Dict, Optional
+import gzip
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from urllib3.util.retry import Retry
 
 from alteia.core.connection.connection import Connection
-from alteia.core.utils.utils import sanitize_dict
+from alteia.core.errors import ResponseError
+from alteia.core.utils import json_utils
+from alteia.core.utils.cache import TTLCache
+from alteia.core.utils.utils import concurrent_map, sanitize_dict
 
 DEFAULT_API_TIMEOUT = 600.0  # value in seconds
 DEFAULT_MAX_ELEMENTS_PER_DESCRIBE_REQUEST = 1000
 DEFAULT_MAX_ELEMENTS_PER_DELETE_REQUEST = 100
 
+# Default request headers, never mutated (the connection copies them)
+_NO_CACHE_HEADERS = {'Cache-Control': 'no-cache'}
+_JSON_HEADERS = {'Cache-Control': 'no-cache', 'Content-Type': 'application/json'}
+_OCTET_HEADERS = {'Cache-Control': 'no-cache', 'Content-Type': 'application/octet-stream'}
+# Data of these types is sent as is, being already serialized
+_SERIALIZED_TYPES = (bytes, bytearray, memoryview)
+
 
 class Provider:
     _root_path = ''
     api_timeout = DEFAULT_API_TIMEOUT
     max_per_describe = DEFAULT_MAX_ELEMENTS_PER_DESCRIBE_REQUEST
+    # Time in seconds during which the describe chunk size is kept lowered
+    # after a describe request is rejected as too large
+    describe_size_ttl = 600.0
     max_per_delete = DEFAULT_MAX_ELEMENTS_PER_DELETE_REQUEST
-
-    def __init__(self, connection: Connection):
+    # Time to live in seconds of the cached descriptions, for managers
+    # caching them (disabled by default)
+    describe_cache_ttl: Optional[float] = None
+    # Size in bytes above which JSON request bodies are gzip-compressed,
+    # for APIs accepting compressed requests (disabled by default)
+    compress_min_size: Optional[int] = None
+
+    def __init__(self, connection: Connection, *, describe_cache_ttl: float = None,
+                 compress_min_size: int = None):
         self._connection = connection
+        if describe_cache_ttl is not None:
+            self.describe_cache_ttl = describe_cache_ttl
+        if compress_min_size is not None:
+            self.compress_min_size = compress_min_size
+        self._url_prefix = f'{self._root_path}/'
+        self._describe_caches: Dict[str, TTLCache] = {}
+        # Lowered describe chunk size and its expiration time
+        self._describe_size: Optional[Tuple[int, float]] = None
+
+    def describe_cache(self, name: str) -> TTLCache:
+        """Return the cache of the descriptions of a type of resources.
+
+        The cache is shared by the resource managers using this provider,
+        so that a manager changing resources managed by another one can
+        invalidate their cached descriptions.
+
+        Args:
+            name: Name of the type of resources (e.g. ``'trials'``).
+
+        Returns:
+            The descriptions cache, whose entries expire after
+            ``describe_cache_ttl`` seconds (nothing is cached when
+            ``describe_cache_ttl`` is not set).
+
+        """
+        return self._describe_caches.setdefault(name, TTLCache(ttl=self.describe_cache_ttl or 0))
+
+    def describe_chunk_size(self) -> int:
+        """Return the maximum number of identifiers per describe request.
+
+        Returns:
+            ``max_per_describe``, or a lower size for ``describe_size_ttl``
+            seconds after a describe request is rejected as too large.
+
+        """
+        describe_size = self._describe_size
+        if describe_size is not None:
+            size, expiration = describe_size
+            if time.monotonic() < expiration:
+                return min(size, self.max_per_describe)
+            self._describe_size = None
+        return self.max_per_describe
 
     def get(self, path, *, preload_content=True, as_json=True,
             timeout=None, headers: Optional[Dict[str, Any]] = None):
-        request_headers = {'Cache-Control': 'no-cache'}
-        if headers:
-            request_headers.update(headers)
+        request_headers = {**_NO_CACHE_HEADERS, **headers} if headers else _NO_CACHE_HEADERS
 
-        full_path = f'{self._root_path}/{path}'
+        full_path = self._url_prefix + path
         content = self._connection.get(path=full_path,
                                        headers=request_headers,
                                        timeout=timeout or self.api_timeout,
@@ -33,9 +96,35 @@ class Provider:
 
         return content
 
+    def get_iter(self, path, *, key: str = None, timeout=None,
+                 headers: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """Get and iterate over the items of a JSON array in the response.
+
+        If ``ijson`` is installed, the items are decoded incrementally
+        while the response is read, instead of decoding the whole
+        response at once.
+
+        Args:
+            path: Relative URL.
+
+            key: Optional key of the array in the response object (the
+                response must be an array otherwise).
+
+            timeout: Timeout in seconds for API call
+
+            headers: Headers in dict format
+
+        Returns:
+            An iterator over the array items.
+
+        """
+        response = self.get(path, preload_content=False, as_json=False,
+                            timeout=timeout, headers=headers)
+        yield from _iter_json_items(response, key=key)
+
     def post(self, path, data, *, sanitize=False, serialize=True,
              preload_content=True, as_json=True, timeout=None,
-             headers: Optional[Dict[str, Any]] = None):
+             headers: Optional[Dict[str, Any]] = None, retries: Retry = None):
         """Post the given data.
 
         Args:
@@ -46,7 +135,9 @@ class Provider:
             sanitize: Whether to recursively remove special characters
                 from data keys.
 
-            serialize: Whether to serialize ``data`` to JSON.
+            serialize: Whether to send ``data`` as JSON. Data already
+                serialized to JSON can be passed as bytes to skip the
+                serialization (e.g. a payload sent several times).
 
             preload_content: Whether to preload the response content.
 
@@ -56,32 +147,143 @@ class Provider:
 
             headers: Headers in dict format
 
+            retries: Optional retry policy (default to the connection one).
+
         Returns:
             Response body eventually deserialized.
 
         """
-        if sanitize:
-            data = sanitize_dict(data)
+        if not isinstance(data, _SERIALIZED_TYPES):
+            if sanitize:
+                data = sanitize_dict(data)
+            if serialize:
+                data = json_utils.dumps(data)
 
         if serialize:
-            data = json.dumps(data)
-            content_type = 'application/json'
+            request_headers = _JSON_HEADERS
         else:
-            content_type = 'application/octet-stream'
+            request_headers = _OCTET_HEADERS
 
-        request_headers = {'Cache-Control': 'no-cache', 'Content-Type': content_type}
+        if serialize and self.compress_min_size is not None and len(data) > self.compress_min_size:
+            data = gzip.compress(data, compresslevel=1)
+            request_headers = {**request_headers, 'Content-Encoding': 'gzip'}
         if headers:
-            request_headers.update(headers)
+            request_headers = {**request_headers, **headers}
 
-        full_path = f'{self._root_path}/{path}'
+        full_path = self._url_prefix + path
         content = self._connection.post(path=full_path,
                                         headers=request_headers,
                                         data=data,
                                         timeout=timeout or self.api_timeout,
                                         as_json=as_json,
-                                        preload_content=preload_content)
+                                        preload_content=preload_content,
+                                        retries=retries)
         return content
 
+    def post_many(self, path, data_list: List[Any], **kwargs) -> List[Any]:
+        """Post each of the given data, concurrently.
+
+        Meant for the chunks of a bulk operation (e.g. describe or delete
+        requests of many identifiers).
+
+        Args:
+            path: Relative URL.
+
+            data_list: The data to send, one request being sent for each.
+
+            **kwargs: Optional keyword arguments passed to ``post()``.
+
+        Returns:
+            The response bodies, in the order of ``data_list``.
+
+        """
+        return concurrent_map(lambda data: self.post(path, data, **kwargs), data_list)
+
+    def post_iter(self, path, data, *, sanitize=False, timeout=None,
+                  headers: Optional[Dict[str, Any]] = None,
+                  retries: Retry = None) -> Iterator[Any]:
+        """Post the given data and iterate over the items of the JSON array response.
+
+        If ``ijson`` is installed, the items are decoded incrementally
+        while the response is read, instead of decoding the whole
+        response at once.
+
+        Args:
+            path: Relative URL.
+
+            data: The data to send.
+
+            sanitize: Whether to recursively remove special characters
+                from data keys.
+
+            timeout: Timeout in seconds for API call
+
+            headers: Headers in dict format
+
+            retries: Optional retry policy (default to the connection one).
+
+        Returns:
+            An iterator over the response items.
+
+        """
+        response = self.post(path, data, sanitize=sanitize, preload_content=False,
+                             as_json=False, timeout=timeout, headers=headers,
+                             retries=retries)
+        yield from _iter_json_items(response)
+
+    def post_describe(self, path, *, ids_param: str, ids: List[str],
+                      data: Optional[Dict[str, Any]] = None,
+                      factory: Callable[[dict], Any] = None) -> List[Any]:
+        """Post a describe request for the given identifiers.
+
+        When the request is rejected as too large (status 413), the
+        identifiers are described in two halves, and the size of a half
+        is returned by ``describe_chunk_size()`` for the next
+        ``describe_size_ttl`` seconds. ``max_per_describe`` is left
+        unchanged.
+
+        Args:
+            path: Relative URL.
+
+            ids_param: Name of the request parameter holding the identifiers.
+
+            ids: Identifiers of the resources to describe.
+
+            data: Optional extra data to send.
+
+            factory: Optional function applied to every description as
+                soon as it is decoded (e.g. ``Resource.from_dict``), so
+                that the decoded descriptions are not all kept in memory
+                next to the returned objects.
+
+        Returns:
+            The resource descriptions, eventually converted by ``factory``.
+
+        """
+        try:
+            items = self.post_iter(path, data={**(data or {}), ids_param: ids},
+                                   retries=self._describe_retries())
+            return list(items if factory is None else map(factory, items))
+        except ResponseError as e:
+            if e.status != 413 or len(ids) <= 1:
+                raise
+
+        half = len(ids) // 2
+        self._describe_size = (min(half, self.describe_chunk_size()),
+                               time.monotonic() + self.describe_size_ttl)
+        return (self.post_describe(path, ids_param=ids_param, ids=ids[:half], data=data,
+                                   factory=factory)
+                + self.post_describe(path, ids_param=ids_param, ids=ids[half:], data=data,
+                                     factory=factory))
+
+    def _describe_retries(self) -> Optional[Retry]:
+        # Retrying a too large request is pointless, it is split instead
+        retries = getattr(self._connection, 'retries', None)
+        if not isinstance(retries, Retry) or 413 not in (retries.status_forcelist or ()):
+            return None
+        return retries.new(status_forcelist=[status for status in retries.status_forcelist
+                                             if status != 413])
+
     def put(self, path, data, *, sanitize=True, serialize=True,
             preload_content=True, as_json=True, timeout=None,
             headers: Optional[Dict[str, Any]] = None):
@@ -93,9 +295,12 @@ class Provider:
             data: The data to send.
 
             sanitize: Whether to recursively remove special characters
-                from data keys.
+                from data keys (pass ``False`` for data whose keys are
+                known to be safe, to skip the recursive walk).
 
-            serialize: Whether to serialize ``data`` to JSON.
+            serialize: Whether to send ``data`` as JSON. Data already
+                serialized to JSON can be passed as bytes to skip the
+                serialization (e.g. a payload sent several times).
 
             preload_content: Whether to preload the response content.
 
@@ -109,21 +314,21 @@ class Provider:
             Response body eventually deserialized.
 
         """
-        if sanitize:
-            data = sanitize_dict(data)
+        if not isinstance(data, _SERIALIZED_TYPES):
+            if sanitize:
+                data = sanitize_dict(data)
+            if serialize:
+                data = json_utils.dumps(data)
 
         if serialize:
-            data = json.dumps(data)
-            content_type = 'application/json'
+            request_headers = _JSON_HEADERS
         else:
-            content_type = 'application/octet-stream'
+            request_headers = _OCTET_HEADERS
 
-        request_headers = {'Cache-Control': 'no-cache', 'Content-Type': content_type}
         if headers:
-            request_headers.update(headers)
+            request_headers = {**request_headers, **headers}
 
-        path = f'{self._root_path}/{path}'
-        content = self._connection.put(path=path,
+        content = self._connection.put(path=self._url_prefix + path,
                                        headers=request_headers,
                                        data=data,
                                        timeout=timeout or self.api_timeout,
@@ -151,12 +356,9 @@ class Provider:
             Response body eventually deserialized.
 
         """
-        request_headers = {'Cache-Control': 'no-cache', 'Content-Type': 'application/json'}
-        if headers:
-            request_headers.update(headers)
+        request_headers = {**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS
 
-        path = f'{self._root_path}/{path}'
-        content = self._connection.delete(path=path,
+        content = self._connection.delete(path=self._url_prefix + path,
                                           headers=request_headers,
                                           timeout=timeout or self.api_timeout,
                                           preload_content=preload_content,
@@ -164,19 +366,44 @@ class Provider:
         return content
 
 
+def _iter_json_items(response, key: str = None) -> Iterator[Any]:
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+    if ijson is None:
+        try:
+            content = json_utils.loads(response.data)
+        finally:
+            response.release_conn()
+        yield from content if key is None else content.get(key, ())
+        return
+
+    prefix = 'item' if key is None else f'{key}.item'
+    try:
+        yield from ijson.items(response, prefix, use_float=True)
+    except BaseException:
+        # The body may not be fully read (e.g. the generator is closed
+        # early): close the connection so that it is not reused
+        response.close()
+        raise
+    finally:
+        response.release_conn()
+
+
 class WithSearchRoute():
     _search_path = 'search'
-    timeout = DEFAULT_API_TIMEOUT
 
     def search(self, path, query):
         """Search objects.
 
         """
         content = self._connection.post(
-            path=f'{self._root_path}/{path}/{self._search_path}',
-            headers={'Cache-Control': 'no-cache', 'Content-Type': 'application/json'},
-            data=json.dumps(query),
-            timeout=self.timeout,
+            path=f'{self._url_prefix}{path}/{self._search_path}',
+            headers=_JSON_HEADERS,
+            data=json_utils.dumps(query),
+            timeout=self.api_timeout,
             as_json=True)
 
         return content
@@ -188,64 +415,51 @@ class FeaturesServiceAPI(Provider):
 
 class AnnotationsAPI(Provider):
     _root_path = 'map-service/annotations'
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class AuthAPI(WithSearchRoute, Provider):
     _root_path = 'dxauth'
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class DataManagementAPI(Provider):
     _root_path = 'data-manager'
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class ProjectManagerAPI(Provider):
     _root_path = 'project-manager'  # alias of uisrv
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class AnalyticsServiceAPI(Provider):
     _root_path = 'analytics-service'
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class CredentialsServiceAPI(Provider):
     _root_path = 'credentials-service'
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class AssetManagementAPI(Provider):
     _root_path = 'dct-service/asset-management'
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class CollectionTaskAPI(Provider):
     _root_path = 'dct-service/task'
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class CollectionTaskManagementAPI(Provider):
     _root_path = 'dct-service/task-management'
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class DataflowServiceAPI(Provider):
     _root_path = 'dataflow'
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class SeasonPlannerAssetManagementAPI(Provider):
     _root_path = 'season-planner/asset-management'
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class SeasonPlannerTrialManagementAPI(Provider):
     _root_path = 'season-planner/trial-management'
-    api_timeout = DEFAULT_API_TIMEOUT
 
 
 class SeasonPlannerAPI(Provider):
     _root_path = 'season-planner'
-    api_timeout = DEFAULT_API_TIMEOUT
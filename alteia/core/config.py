@@ -2,11 +2,11 @@
 
 """
 
+import functools
 import json
 import logging
 import os
-
-from appdirs import user_data_dir
+import sys
 
 from alteia.core.utils.filehelper import read_file
 
@@ -14,11 +14,28 @@ LOGGER = logging.getLogger(__name__)
 
 APPNAME = "alteia"
 APPAUTHOR = "Alteia"
-DEFAULT_CONF_DIR = user_data_dir(APPNAME, APPAUTHOR)
 DEFAULT_URL = 'https://app.alteia.com'
 DEFAULT_CONNECTION_CONF = {'disable_ssl_certificate': True}
 
 
+@functools.lru_cache(maxsize=None)
+def _default_conf_dir() -> str:
+    # Only needed when no configuration file is given
+    from appdirs import user_data_dir
+    return user_data_dir(APPNAME, APPAUTHOR)
+
+
+def __getattr__(name):
+    # DEFAULT_CONF_DIR is computed on first access
+    if name == 'DEFAULT_CONF_DIR':
+        return _default_conf_dir()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+if sys.version_info < (3, 7):  # no module __getattr__ support
+    DEFAULT_CONF_DIR = _default_conf_dir()
+
+
 class ConnectionConfig:
     """Connection configuration.
 
@@ -70,7 +87,7 @@ class ConnectionConfig:
             LOGGER.info(f'Load custom configuration file from {file_path}')
             custom_conf = json.loads(read_file(file_path=file_path))
         else:
-            user_conf_path = os.path.join(DEFAULT_CONF_DIR, 'config-connection.json')
+            user_conf_path = os.path.join(_default_conf_dir(), 'config-connection.json')
             if os.path.exists(user_conf_path):
                 LOGGER.info(f'Load user configuration file from {user_conf_path}')
                 custom_conf = json.loads(read_file(file_path=user_conf_path))
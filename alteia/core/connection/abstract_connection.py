@@ -19,23 +19,38 @@ class AbstractConnection:
         self._base_url = base_url[:-1] if base_url.endswith('/') else base_url
         self._token_manager = token_manager
         self._retries = retries
-        self._user_agent = None
         self._user_agents = DEFAULT_USER_AGENTS.copy()
+        self._user_agent = self._join_user_agents()
         self._netloc = urllib.parse.urlsplit(base_url).netloc
+        self._base_url_prefix = f'{self._base_url}/'
+        self._base_url_has_path = bool(urllib.parse.urlsplit(self._base_url).path)
 
     def _renew_token(self):
         self._token_manager.renew_token()
 
+    def _build_url(self, path: str) -> str:
+        """Return the URL of ``path``, like ``urljoin(base_url, path)``."""
+        # Plain relative paths (as built by the providers) are appended to
+        # the base URL, sparing urljoin() parsing both
+        if (self._base_url_has_path or not path or path[0] in '/.?#' or '//' in path
+                or '/.' in path or ':' in path.partition('/')[0]):
+            return urllib.parse.urljoin(self._base_url, path)
+        return self._base_url_prefix + path
+
+    def _is_same_host(self, url: str) -> bool:
+        # Fast path for the URLs built from the base URL
+        if url.startswith(self._base_url_prefix):
+            return True
+        return urllib.parse.urlsplit(url).netloc == self._netloc
+
     def _add_authorization_maybe(self, headers: dict, url: str):
-        netloc = urllib.parse.urlsplit(url).netloc
-        if netloc != self._netloc:
+        if not self._is_same_host(url):
             LOGGER.info('No need for authorization header')
             return
 
-        token = self._token_manager.token
-        if token.token_type and token.access_token:
-            auth = f'{token.token_type} {token.access_token}'
-            headers['Authorization'] = auth
+        authorization = self._token_manager.authorization
+        if authorization:
+            headers['Authorization'] = authorization
         elif 'Authorization' not in headers:
             LOGGER.warning('Authorization header not set')
 
@@ -54,12 +69,10 @@ class AbstractConnection:
             params['body_pos'] = 0
 
     def _add_user_agent(self, headers: dict):
-        if 'User-Agent' not in headers:
-            headers['User-Agent'] = self.user_agent
+        headers.setdefault('User-Agent', self._user_agent)
 
     def _add_referer(self, headers: dict):
-        if 'referer' not in headers:
-            headers['referer'] = self._base_url
+        headers.setdefault('referer', self._base_url)
 
     def set_user_agent(self, user_agent: str, *,
                        remove_last=False, reset_to_default=False, remove_all=False):
@@ -71,14 +84,20 @@ class AbstractConnection:
             self._user_agents = []
         if user_agent:
             self._user_agents.append(user_agent)
-        self._user_agent = None
+        self._user_agent = self._join_user_agents()
+
+    def _join_user_agents(self) -> str:
+        return ' '.join(reversed(self._user_agents))
 
     @property
     def user_agent(self):
-        if not self._user_agent:
-            self._user_agent = ' '.join(reversed(self._user_agents))
         return self._user_agent
 
+    @property
+    def retries(self):
+        """Retry policy of the requests, unless given per request."""
+        return self._retries
+
     @staticmethod
     def _encode_spaces(url):
         return url.replace(' ', '_')
@@ -3,7 +3,6 @@ import logging
 import os
 from threading import Lock
 from typing import Callable
-from urllib.parse import urljoin
 
 import urllib3
 
@@ -23,7 +22,7 @@ def _load_url(http: urllib3.request.RequestMethods, cb: Callable = None, **param
 class AsyncConnection(AbstractConnection):
     def __init__(self, *, base_url, disable_ssl_certificate,
                  token_manager, retries, max_requests_workers=None,
-                 proxy_url=None):
+                 proxy_url=None, http: urllib3.PoolManager = None):
         super().__init__(base_url=base_url,
                          disable_ssl_certificate=disable_ssl_certificate,
                          token_manager=token_manager, retries=retries)
@@ -32,6 +31,15 @@ class AsyncConnection(AbstractConnection):
             max_requests_workers = MAX_REQUESTS_WORKERS
         self._executor = cf.ThreadPoolExecutor(max_workers=max_requests_workers)
         self._max_requests_workers = max_requests_workers
+        if http is not None:
+            # Share the kept-alive connections of the given pool, whose
+            # limits are set by its owner. Even if that pool doesn't
+            # block when all its connections are in use, the requests
+            # sent from here are bounded by the max_requests_workers
+            # threads of the executor
+            self._http = http
+            return
+
         manager_kw = {'cert_reqs': ('CERT_NONE' if disable_ssl_certificate
                                     else 'CERT_REQUIRED'),
                       'num_pools': max_requests_workers}
@@ -52,13 +60,17 @@ class AsyncConnection(AbstractConnection):
     def max_request_workers(self):
         return self._max_requests_workers
 
+    def close(self):
+        """Close the kept-alive connections of the pool."""
+        self._http.clear()
+
     def _add_authorization_maybe(self, headers: dict, url: str):
         with self._access_token_lock:
             super()._add_authorization_maybe(headers, url)
 
     def post(self, path, headers=None, callback=None, data=None, timeout=None,
              retries=None):
-        url = urljoin(self._base_url, path)
+        url = self._build_url(path)
         params = {'method': 'POST',
                   'url': url,
                   'headers': headers,
@@ -69,7 +81,7 @@ class AsyncConnection(AbstractConnection):
 
     def put(self, path, headers=None, callback=None, data=None, timeout=None,
             retries=None):
-        url = urljoin(self._base_url, self._encode_spaces(path))
+        url = self._build_url(self._encode_spaces(path))
         params = {'method': 'PUT',
                   'url': url,
                   'headers': headers,
@@ -79,14 +91,11 @@ class AsyncConnection(AbstractConnection):
         return self._send_request(params=params, on_finish_callback=callback)
 
     def _send_request(self, params, on_finish_callback):
-        params['headers'] = params['headers'] or {}
+        params['headers'] = dict(params['headers'] or ())
         params['timeout'] = params['timeout'] or self.request_timeout
+        token = self._token_manager.token
         self._add_authorization_maybe(params['headers'], params['url'])
         self._add_user_agent(params['headers'])
-        try:
-            token = params['headers']['Authorization'].split('Bearer')[1].strip()
-        except KeyError:
-            token = None
 
         def extended_callback(response, *args, **kwargs):
             if response.status == 401:
@@ -94,7 +103,7 @@ class AsyncConnection(AbstractConnection):
                 skip = self._skip_token_renewal(params['url'])
                 if not skip:
                     with self._access_token_lock:  # block concurrent send requests
-                        renewed = (token != self._token_manager.token.access_token)
+                        renewed = token is not self._token_manager.token
                         if renewed:
                             LOGGER.debug('Token already renewed')
                         else:
@@ -1,22 +1,44 @@
-import json
 import logging
-from urllib.parse import urljoin
+import random
 
 import urllib3
 from urllib3.util.retry import Retry
 
 from alteia.core.connection.abstract_connection import AbstractConnection
-from alteia.core.connection.async_connection import AsyncConnection
+from alteia.core.connection.async_connection import (MAX_REQUESTS_WORKERS,
+                                                     AsyncConnection)
 from alteia.core.connection.token import TokenManager
 from alteia.core.errors import ResponseError
+from alteia.core.utils import json_utils
+from alteia.core.utils.cache import TTLCache
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum backoff in seconds (Retry.BACKOFF_MAX is deprecated since urllib3 1.26.9)
+_BACKOFF_MAX = getattr(Retry, 'DEFAULT_BACKOFF_MAX', None) or Retry.BACKOFF_MAX
+
+
+class _JitteredRetry(Retry):
+    """Retry configuration adding a random delay to the exponential backoff.
+
+    Spreads the retries of concurrent requests failing together (e.g.
+    chunks of a describe request sent from the thread pool).
+
+    """
+    BACKOFF_JITTER = 0.5
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return min(_BACKOFF_MAX, backoff + random.uniform(0, self.BACKOFF_JITTER))
+
 
 class Connection(AbstractConnection):
     def __init__(self, *, base_url, disable_ssl_certificate=False,
                  credentials=None, max_retries=10,
-                 access_token=None, proxy_url=None):
+                 access_token=None, proxy_url=None, pool_maxsize=None,
+                 etag_cache_size=None):
         super().__init__(base_url=base_url,
                          disable_ssl_certificate=disable_ssl_certificate)
 
@@ -25,18 +47,34 @@ class Connection(AbstractConnection):
             cert_reqs = 'CERT_NONE'
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+        # Keep as many connections alive per host as concurrent requests
+        # may be sent (e.g. chunks of a describe request). The pool is
+        # shared with the asynchronous connection; it does not block, so
+        # that streamed responses held by the caller can't starve other
+        # requests, extra connections being closed once released
+        pool_kw = {'cert_reqs': cert_reqs,
+                   'maxsize': pool_maxsize or MAX_REQUESTS_WORKERS,
+                   'block': False}
         if proxy_url is not None:
-            self._http = urllib3.ProxyManager(proxy_url=proxy_url,
-                                              cert_reqs=cert_reqs)
+            self._http = urllib3.ProxyManager(proxy_url=proxy_url, **pool_kw)
         else:
-            self._http = urllib3.PoolManager(cert_reqs=cert_reqs)
-
-        self._retries = Retry(total=max_retries, backoff_factor=1,
-                              status_forcelist=[409, 413, 429,
-                                                500, 502, 503, 504],
-                              allowed_methods=frozenset(
-                                  ['HEAD', 'GET', 'PUT', 'DELETE', 'OPTIONS',
-                                   'TRACE', 'POST']))
+            self._http = urllib3.PoolManager(**pool_kw)
+
+        # Bodies of GET responses with an ETag, by URL, revalidated with
+        # If-None-Match (disabled by default)
+        self._etag_cache = (TTLCache(ttl=float('inf'), max_size=etag_cache_size)
+                            if etag_cache_size else None)
+
+        # Once the retries are exhausted, the last response is returned
+        # and raised as a ResponseError like any other error status
+        self._retries = _JitteredRetry(total=max_retries, backoff_factor=0.3,
+                                       respect_retry_after_header=True,
+                                       raise_on_status=False,
+                                       status_forcelist=[409, 413, 429,
+                                                         500, 502, 503, 504],
+                                       allowed_methods=frozenset(
+                                           ['HEAD', 'GET', 'PUT', 'DELETE', 'OPTIONS',
+                                            'TRACE', 'POST']))
 
         token_type = 'Bearer' if access_token else None
         self._token_manager = TokenManager(connection=self,
@@ -49,18 +87,23 @@ class Connection(AbstractConnection):
                 disable_ssl_certificate=disable_ssl_certificate,
                 token_manager=self._token_manager,
                 retries=self._retries,
-                proxy_url=proxy_url)
+                proxy_url=proxy_url,
+                http=self._http)
 
     @property
     def asynchronous(self):
         return self._async_connection
 
+    def close(self):
+        """Close the kept-alive connections (shared by the sync and async requests)."""
+        self._http.clear()
+
     def post(self, path, headers=None, data=None, timeout=None, as_json=False,
              preload_content=True, retries=None):
         """
             POST utility method
         """
-        url = urljoin(self._base_url, path)
+        url = self._build_url(path)
         params = {'url': url,
                   'body': data or {},
                   'headers': headers,
@@ -70,7 +113,7 @@ class Connection(AbstractConnection):
                   'preload_content': preload_content}
         resp = self._send_request(params)
         if as_json:
-            return json.loads(resp.data.decode('utf-8'))
+            return json_utils.loads(resp.data)
         if preload_content:
             return resp.data
         return resp
@@ -80,26 +123,48 @@ class Connection(AbstractConnection):
         """
              GET utility method
         """
-        url = urljoin(self._base_url, path)
+        url = self._build_url(path)
         params = {'url': url,
                   'headers': headers,
                   'method': 'GET',
                   'timeout': timeout,
                   'retries': retries or self._retries,
                   'preload_content': preload_content}
+        if self._etag_cache is not None and preload_content:
+            data = self._get_with_etag(params)
+            return json_utils.loads(data) if as_json else data
+
         resp = self._send_request(params)
         if as_json:
-            return json.loads(resp.data.decode('utf-8'))
+            return json_utils.loads(resp.data)
         if preload_content:
             return resp.data
         return resp
 
+    def _get_with_etag(self, params) -> bytes:
+        url = params['url']
+        cached = self._etag_cache.get(url)
+        if cached is not None:
+            params['headers'] = {**(params['headers'] or {}), 'If-None-Match': cached[0]}
+
+        resp = self._send_request(params)
+        if resp.status == 304:
+            LOGGER.debug(f'Not modified: {url}')
+            return cached[1] if cached is not None else resp.data
+
+        etag = resp.headers.get('ETag')
+        if etag:
+            self._etag_cache.set(url, (etag, resp.data))
+        else:
+            self._etag_cache.invalidate(url)
+        return resp.data
+
     def put(self, path, headers=None, data=None, timeout=None, as_json=False,
             preload_content=True, retries=None):
         """
             PUT utility method
         """
-        url = urljoin(self._base_url, path)
+        url = self._build_url(path)
         params = {'url': url,
                   'body': data or {},
                   'headers': headers,
@@ -109,7 +174,7 @@ class Connection(AbstractConnection):
                   'preload_content': preload_content}
         resp = self._send_request(params)
         if as_json:
-            return json.loads(resp.data.decode('utf-8'))
+            return json_utils.loads(resp.data)
         if preload_content:
             return resp.data
         return resp
@@ -119,7 +184,7 @@ class Connection(AbstractConnection):
         """
             DELETE utility method
         """
-        url = urljoin(self._base_url, path)
+        url = self._build_url(path)
         params = {'url': url,
                   'body': data or {},
                   'headers': headers,
@@ -128,13 +193,15 @@ class Connection(AbstractConnection):
                   'retries': retries or self._retries}
         resp = self._send_request(params)
         if as_json:
-            return json.loads(resp.data.decode('utf-8'))
+            return json_utils.loads(resp.data)
         if preload_content:
             return resp.data
         return resp
 
     def _send_request(self, params):
-        params['headers'] = params['headers'] or {}
+        # Copied since authorization, user agent and referer are added
+        # to it (callers may pass shared dicts)
+        params['headers'] = dict(params['headers'] or ())
         params['timeout'] = params['timeout'] or self.request_timeout
         self._add_authorization_maybe(params['headers'], params['url'])
         self._add_user_agent(params['headers'])
@@ -149,14 +216,19 @@ class Connection(AbstractConnection):
             LOGGER.debug('Got a 401 status')
             skip = self._skip_token_renewal(params['url'])
             if not skip:
+                # Give the connection back to the pool before retrying
+                response.drain_conn()
                 self._renew_token()
                 self._add_authorization_maybe(params['headers'], params['url'])
 
                 LOGGER.debug('Retrying to request using the new token..')
                 response = self._http.request(**params)
 
-        if response.status not in range(200, 300):
-            raise ResponseError(msg=f'{response.status}: {response.data[:256]}', status=response.status)
+        if response.status not in range(200, 300) and not (
+                response.status == 304 and 'If-None-Match' in params['headers']):
+            msg = f'{response.status}: {response.data[:256]}'
+            response.release_conn()
+            raise ResponseError(msg=msg, status=response.status)
 
         return response
 
@@ -171,6 +243,8 @@ class Connection(AbstractConnection):
         response = self._http.request(**params)
 
         if response.status not in range(200, 300):
-            raise ResponseError(msg=f'{response.status}: {response.data[:256]}', status=response.status)
+            msg = f'{response.status}: {response.data[:256]}'
+            response.release_conn()
+            raise ResponseError(msg=msg, status=response.status)
 
         return response
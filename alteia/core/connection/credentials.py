@@ -4,6 +4,8 @@
 
 import base64
 
+from alteia.core.utils import json_utils
+
 
 class Credentials():
     """Base class for connection credentials."""
@@ -12,15 +14,28 @@ class Credentials():
         self._data = data
         secret = f'{client_id}:{client_secret}'
         self._encoded_secret = base64.b64encode(secret.encode()).decode()
+        # Sent as is on every token renewal
+        self._authorization = f'Basic {self._encoded_secret}'
+        self._serialized_data = json_utils.dumps(data)
 
     @property
     def encoded_secret(self):
         return self._encoded_secret
 
+    @property
+    def authorization(self) -> str:
+        """Value of the Authorization header of token requests."""
+        return self._authorization
+
     @property
     def data(self):
         return self._data
 
+    @property
+    def serialized_data(self) -> bytes:
+        """Data of token requests, serialized to JSON."""
+        return self._serialized_data
+
 
 class ClientCredentials(Credentials):
     """Client credentials."""
@@ -1,10 +1,9 @@
 import collections
-import json
 import logging
-import urllib.parse
 from typing import Any, Dict, Optional
 
 from alteia.core.errors import TokenRenewalError
+from alteia.core.utils import json_utils
 
 LOGGER = logging.getLogger(__name__)
 
@@ -12,14 +11,28 @@ Token = collections.namedtuple('Token',
                                ('access_token', 'token_type',
                                 'expires_in', 'refresh_token'))
 
+_TOKEN_PATH = '/dxauth/oauth/token'
+_REVOKE_TOKEN_PATH = '/dxauth/oauth2/revoke'
+_DESCRIBE_TOKEN_PATH = '/dxauth/describe-token'
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
 
 class TokenManager():
     def __init__(self, *, connection, credentials,
                  access_token=None, token_type=None):
         self._connection = connection
         self._credentials = credentials
-        self._token = Token(access_token, token_type, None, None)
-        self._path = urllib.parse.urlsplit('/dxauth/oauth/token').path
+        self._set_token(Token(access_token, token_type, None, None))
+        self._path = _TOKEN_PATH
+        # The connection copies the headers before adding its own
+        self._renewal_headers = ({**_JSON_HEADERS, 'Authorization': credentials.authorization}
+                                 if credentials else None)
+
+    def _set_token(self, token: Token):
+        # The token and its Authorization header value are replaced at once
+        authorization = (f'{token.token_type} {token.access_token}'
+                         if token.token_type and token.access_token else None)
+        self._state = (token, authorization)
 
     @property
     def credentials(self):
@@ -27,7 +40,12 @@ class TokenManager():
 
     @property
     def token(self):
-        return self._token
+        return self._state[0]
+
+    @property
+    def authorization(self) -> Optional[str]:
+        """Value of the Authorization header for the current token, if any."""
+        return self._state[1]
 
     def renew_token(self):
         if not self._credentials:
@@ -35,21 +53,17 @@ class TokenManager():
             return
 
         LOGGER.debug('Trying to get a new token...')
-        self._token = Token(None, None, None, None)
-        headers = {'Authorization':
-                   f'Basic {self._credentials.encoded_secret}',
-                   'Content-Type': 'application/json'}
-        data = json.dumps(self._credentials.data)
+        self._set_token(Token(None, None, None, None))
         decoded_data = self._connection.post(path=self._path,
-                                             data=data,
-                                             headers=headers,
+                                             data=self._credentials.serialized_data,
+                                             headers=self._renewal_headers,
                                              as_json=True)
 
         if 'access_token' in decoded_data:
-            self._token = Token._make((decoded_data['access_token'],
-                                       decoded_data['token_type'],
-                                       decoded_data['expires_in'],
-                                       decoded_data['refresh_token']))
+            self._set_token(Token(decoded_data['access_token'],
+                                  decoded_data['token_type'],
+                                  decoded_data['expires_in'],
+                                  decoded_data['refresh_token']))
             LOGGER.debug('Got a new token')
         else:
             LOGGER.error(f'Unsupported response: {decoded_data}')
@@ -65,10 +79,10 @@ class TokenManager():
         params = kwargs
         if token is not None:
             params['token'] = token
-        data = json.dumps(params)
+        data = json_utils.dumps(params)
         self._connection.post(
-            path='/dxauth/oauth2/revoke',
-            headers={'Content-Type': 'application/json'},
+            path=_REVOKE_TOKEN_PATH,
+            headers=_JSON_HEADERS,
             data=data,
             as_json=False
         )
@@ -86,10 +100,10 @@ class TokenManager():
         params = kwargs
         if token:
             params['token'] = token
-        data = json.dumps(params)
+        data = json_utils.dumps(params)
         return self._connection.post(
-            path='/dxauth/describe-token',
-            headers={'Content-Type': 'application/json'},
+            path=_DESCRIBE_TOKEN_PATH,
+            headers=_JSON_HEADERS,
             data=data,
             as_json=True
         )
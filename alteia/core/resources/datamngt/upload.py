@@ -3,20 +3,20 @@ Legacy Files uploader.
 New uploader available here: alteia.core.resources.datamngt.uploader.DatasetUploader
 """
 
+import collections
 import concurrent.futures as cf
 import functools
-import hashlib
-import json
 import logging
-import math
 import os
+import threading
 import urllib
 from typing import Optional, Tuple
 
 from alteia.core.connection.abstract_connection import DEFAULT_REQUESTS_TIMEOUT
 from alteia.core.errors import UploadError
+from alteia.core.utils import json_utils
 from alteia.core.utils.typing import AnyPath
-from alteia.core.utils.utils import human_bytes
+from alteia.core.utils.utils import human_bytes, md5_from_blob
 
 LOGGER = logging.getLogger(__name__)
 
@@ -41,7 +41,7 @@ def cfg_multipart_upload(file_size, multipart: bool = True, chunk_size: int = No
         multipart
         chunk_size
     """
-    chunk_size = max(chunk_size or math.ceil(file_size / S3_CHUNK_MAX_PARTS), S3_CHUNK_MIN_SIZE)
+    chunk_size = max(chunk_size or (file_size + S3_CHUNK_MAX_PARTS - 1) // S3_CHUNK_MAX_PARTS, S3_CHUNK_MIN_SIZE)
     chunk_size = min(chunk_size, S3_CHUNK_MAX_SIZE, DM_CHUNK_MAX_SIZE)
 
     # Only last chunk can have a size < to S3_CHUNK_MIN_SIZE, but > 0
@@ -54,6 +54,8 @@ class Chunk:
     """Store the state of the upload of a file chunk.
 
     """
+    __slots__ = ('index', 'size', 'status', 'attempt', 'req')
+
     def __init__(self, index, *, size, status='preupload'):
         self.index = index
         self.size = size
@@ -92,20 +94,16 @@ def prepare_chunks(*, file_size: int, chunk_size: int) -> Tuple[list, int]:
     if file_size <= 0:
         raise ValueError('Expecting a positive file size')
 
-    chunk_count = max(0, math.ceil(file_size / chunk_size))
+    chunk_count = (file_size + chunk_size - 1) // chunk_size
     if chunk_count > S3_CHUNK_MAX_PARTS:
         LOGGER.warning(f'Too many chunks with chunk size = {human_bytes(chunk_size)}, '
                        f'for file size = {human_bytes(file_size)}')
-        chunk_size = math.ceil(file_size / S3_CHUNK_MAX_PARTS)
-        chunk_count = math.ceil(file_size / chunk_size)
+        chunk_size = (file_size + S3_CHUNK_MAX_PARTS - 1) // S3_CHUNK_MAX_PARTS
+        chunk_count = (file_size + chunk_size - 1) // chunk_size
         LOGGER.info(f'New chunk size = {human_bytes(chunk_size)}, '
                     f'with {chunk_count} chunks')
-    chunks = []
-    if chunk_count > 0:
-        for index in range(chunk_count):
-            size = min(chunk_size, file_size - index * chunk_size)
-            chunk = Chunk(index, size=size)
-            chunks.append(chunk)
+    chunks = [Chunk(index, size=min(chunk_size, file_size - index * chunk_size))
+              for index in range(chunk_count)]
     return chunks, chunk_size
 
 
@@ -159,22 +157,6 @@ class MultipartUpload:
     def completion_url(self):
         return f'{self._base_url}/complete-multipart-upload'
 
-    @property
-    def _ongoing_chunks(self):
-        return [c for c in self._chunks
-                if c.status == 'preupload' and c.req is not None
-                and not c.req.done()]
-
-    @property
-    def _unfinished_chunks(self):
-        return [c for c in self._chunks
-                if c.status not in ('available', 'failed')]
-
-    @property
-    def _waiting_chunks(self):
-        return [c for c in self._chunks
-                if c.status not in ('available', 'failed') and c.req is None]
-
     def send(self, file_path: AnyPath, *,
              dataset: str, component_name: str, md5hash: Optional[str] = None):
         """Send a file in multiple requests.
@@ -228,12 +210,21 @@ class MultipartUpload:
 
         self._connection.post(path=self.creation_url,
                               headers=headers,
-                              data=json.dumps(creation_desc))
+                              data=json_utils.dumps(creation_desc))
 
     def _start(self, *, file_path: str, dataset: str, component_name: str):
         async_conn = self._connection.asynchronous
         max_simultaneous = async_conn.max_request_workers
 
+        # Chunks to send, in order, and requests possibly not done yet,
+        # updated as requests are sent and completed (instead of scanning
+        # all the chunks on each iteration)
+        waiting_chunks = collections.deque(self._chunks)
+        ongoing_reqs: set = set()
+        # limit the number of simultaneous requests, a slot being released
+        # once a request is done (even on error)
+        request_slots = threading.BoundedSemaphore(max_simultaneous)
+
         def update_chunk(chunk, resp):
             if resp.status == 200:
                 chunk.status = 'available'
@@ -242,35 +233,29 @@ class MultipartUpload:
             else:
                 chunk.status = 'failed'
             chunk.req = None
+            if chunk.status == 'preupload':
+                # send it again
+                waiting_chunks.append(chunk)
 
         request_delay = DEFAULT_REQUESTS_TIMEOUT
         upload_part_headers = {'Cache-Control': 'no-cache',
                                'Content-Type': 'application/octet-stream'}
         with open(file_path, 'rb') as st:
-            while len(self._unfinished_chunks) > 0:
-                # limit the number of simultaneous enqueued requests
-                queued_requests = async_conn.executor._work_queue.qsize()
-                if queued_requests >= max_simultaneous:
-                    reqs = [c.req for c in self._ongoing_chunks]
-                    cf.wait(reqs, timeout=request_delay,
-                            return_when=cf.FIRST_COMPLETED)
-                    continue
-
-                # check whether all chunks have been sent
-                candidates = self._waiting_chunks
-                if len(candidates) == 0:
+            while True:
+                request_slots.acquire()
+                # stop once all chunks have been sent
+                if not waiting_chunks:
+                    request_slots.release()
                     break
 
                 # send first candidate
-                chunk = candidates[0]
+                chunk = waiting_chunks.popleft()
                 chunk.attempt += 1
 
                 offset = chunk.index * self._chunk_size
                 st.seek(offset)
                 blob = st.read(chunk.size)
-                algo = hashlib.md5()
-                algo.update(blob)
-                md5hash = algo.hexdigest()
+                md5hash = md5_from_blob(blob)
                 # chunk.index must start at 0 to get the proper file offset
                 # however, part_number must start at 1 (S3 requirement)
                 path = self.get_upload_part_url(dataset=dataset,
@@ -278,12 +263,17 @@ class MultipartUpload:
                                                 part_number=chunk.index+1,
                                                 checksum=md5hash)
                 cb = functools.partial(update_chunk, chunk)
-                chunk.req = async_conn.post(path=path,
-                                            headers=upload_part_headers,
-                                            data=blob,
-                                            callback=cb)
-
-            reqs = [c.req for c in self._ongoing_chunks]
+                req = async_conn.post(path=path,
+                                      headers=upload_part_headers,
+                                      data=blob,
+                                      callback=cb)
+                req.add_done_callback(lambda _: request_slots.release())
+                chunk.req = req
+                ongoing_reqs.add(req)
+                if len(ongoing_reqs) > 2 * max_simultaneous:
+                    ongoing_reqs = {r for r in ongoing_reqs if not r.done()}
+
+            reqs = [req for req in ongoing_reqs if not req.done()]
             try:
                 all(cf.as_completed(reqs, timeout=len(reqs) * request_delay))
             except cf.TimeoutError:
@@ -300,4 +290,4 @@ class MultipartUpload:
                            'component': component_name}
         self._connection.post(path=self.completion_url,
                               headers=headers,
-                              data=json.dumps(completion_desc))
+                              data=json_utils.dumps(completion_desc))
@@ -1,15 +1,16 @@
 """
 Dataset File uploader.
 """
+import collections
 import concurrent.futures as cf
 import functools
 import logging
-import math
 import os
+import threading
 
 from enum import Enum
 from types import SimpleNamespace
-from typing import List, Optional, Tuple
+from typing import Deque, List, Optional, Set, Tuple
 from urllib.parse import urlencode
 from urllib3.response import HTTPResponse
 
@@ -72,6 +73,9 @@ class UploadPart:
     """Store the state of the upload of a file part (it's a chunk of the file)
     Mainly taken from legacy Chunk class
     """
+    __slots__ = ('index', 'part_number', 'size', 'status', 'attempt', 'req',
+                 'error', 'put_url', 'put_headers', 'md5hash')
+
     def __init__(self, index: int, *, part_number: int, size: int,
                  status: PartStatus = PartStatus.PENDING):
         self.index: int = index
@@ -238,13 +242,13 @@ class DatasetUploader:
         if self.use_legacy_uploader:
             chunk_size = min(chunk_size, DM_CHUNK_MAX_SIZE)
 
-        nb_parts = max(0, math.ceil(file_size / chunk_size))
+        nb_parts = (file_size + chunk_size - 1) // chunk_size
         if nb_parts > S3_CHUNK_MAX_PARTS:
             # too many parts: adapt the chunk size and recheck it.
             LOGGER.warning(f'Too many chunks with chunk size = {human_bytes(chunk_size)}, '
                            f'for file size = {human_bytes(file_size)}')
-            chunk_size = math.ceil(file_size / S3_CHUNK_MAX_PARTS)
-            nb_parts = math.ceil(file_size / chunk_size)
+            chunk_size = (file_size + S3_CHUNK_MAX_PARTS - 1) // S3_CHUNK_MAX_PARTS
+            nb_parts = (file_size + chunk_size - 1) // chunk_size
             LOGGER.info(f'New chunk size = {human_bytes(chunk_size)}, '
                         f'with {nb_parts} chunks')
             assert_chunk_size(chunk_size, self.use_legacy_uploader)
@@ -404,21 +408,6 @@ class DatasetUploader:
     # New multipart upload: loop on chunks. Mainly taken from legacy class.   #
     # ####################################################################### #
 
-    @property
-    def _ongoing_chunks(self) -> List[UploadPart]:
-        return [c for c in self._chunks
-                if c.status == PartStatus.PENDING and c.req is not None and not c.req.done()]
-
-    @property
-    def _unfinished_chunks(self) -> List[UploadPart]:
-        return [c for c in self._chunks
-                if c.status not in (PartStatus.AVAILABLE, PartStatus.FAILED)]
-
-    @property
-    def _waiting_chunks(self) -> List[UploadPart]:
-        return [c for c in self._chunks
-                if c.status not in (PartStatus.AVAILABLE, PartStatus.FAILED) and c.req is None]
-
     def _get_upload_part_data(self, part_number: int, md5hash: str = None) -> Tuple[str, dict]:
         """Call the provider to get an upload signed URL (+ headers) for a part"""
         data: DictAny = {
@@ -436,6 +425,15 @@ class DatasetUploader:
         async_conn = self._connection.asynchronous
         max_simultaneous = async_conn.max_request_workers
 
+        # Parts to send, in order, and requests possibly not done yet,
+        # updated as requests are sent and completed (instead of scanning
+        # all the parts on each iteration)
+        waiting_chunks: Deque[UploadPart] = collections.deque(self._chunks)
+        ongoing_reqs: Set[cf.Future] = set()
+        # limit the number of simultaneous requests, a slot being released
+        # once a request is done (even on error)
+        request_slots = threading.BoundedSemaphore(max_simultaneous)
+
         def update_part(part: UploadPart, resp: HTTPResponse):
             if resp.status in (200, 204):
                 part.status = PartStatus.AVAILABLE
@@ -445,27 +443,22 @@ class DatasetUploader:
                 part.status = PartStatus.FAILED
                 part.error = resp.data
             part.req = None
+            if part.status not in (PartStatus.AVAILABLE, PartStatus.FAILED):
+                # send it again
+                waiting_chunks.append(part)
 
         request_delay = self._connection.request_timeout
 
         with open(self.file_path, 'rb') as st:
-            while len(self._unfinished_chunks) > 0:
-                # limit the number of simultaneous enqueued requests, use the max of:
-                # - Queue.qsize() is the "approximate size" of the queue (not reliable!)"
-                # - self._ongoing_chunks must be all the unfinished requests
-                queued_requests = async_conn.executor._work_queue.qsize()
-                if max(queued_requests, len(self._ongoing_chunks)) >= max_simultaneous:
-                    reqs = [c.req for c in self._ongoing_chunks]
-                    cf.wait(reqs, timeout=request_delay, return_when=cf.FIRST_COMPLETED)
-                    continue
-
-                # check whether all chunks have been sent
-                candidates = self._waiting_chunks
-                if len(candidates) == 0:
+            while True:
+                request_slots.acquire()
+                # stop once all chunks have been sent
+                if not waiting_chunks:
+                    request_slots.release()
                     break
 
                 # send first candidate
-                chunk = candidates[0]
+                chunk = waiting_chunks.popleft()
                 chunk.attempt += 1
 
                 offset = chunk.index * self._chunk_size
@@ -482,11 +475,16 @@ class DatasetUploader:
                     chunk.put_headers = put_headers
 
                 cb = functools.partial(update_part, chunk)
-                chunk.req = async_conn.external_request(
-                    'PUT', chunk.put_url, body=blob, headers=put_headers, callback=cb,
+                req = async_conn.external_request(
+                    'PUT', chunk.put_url, body=blob, headers=chunk.put_headers, callback=cb,
                 )
+                req.add_done_callback(lambda _: request_slots.release())
+                chunk.req = req
+                ongoing_reqs.add(req)
+                if len(ongoing_reqs) > 2 * max_simultaneous:
+                    ongoing_reqs = {r for r in ongoing_reqs if not r.done()}
 
-            reqs = [c.req for c in self._ongoing_chunks]
+            reqs = [req for req in ongoing_reqs if not req.done()]
             try:
                 all(cf.as_completed(reqs, timeout=len(reqs) * request_delay))
             except cf.TimeoutError:
@@ -1,8 +1,15 @@
 import copy
+import functools
+import itertools
+import json
 import warnings
-from typing import Dict, Generator, List, Optional, Union
+from typing import Dict, Generator, List, Optional, Tuple, Union
 
 from alteia.core.resources.resource import Resource, ResourcesWithTotal
+from alteia.core.utils.cache import TTLCache
+from alteia.core.utils.typing import ResourceId
+from alteia.core.utils.utils import (concurrent_map, get_chunks, get_executor,
+                                     get_running_loop)
 
 ASCENDING = 1
 DESCENDING = -1
@@ -61,7 +68,7 @@ def search(manager, *, url: str, filter: dict = None, fields: dict = None,
 
     descriptions = r.get('results')
 
-    results = [Resource(**desc) for desc in descriptions]
+    results = [Resource.from_dict(desc) for desc in descriptions]
 
     if return_total is True:
         total = r.get('total')
@@ -70,11 +77,248 @@ def search(manager, *, url: str, filter: dict = None, fields: dict = None,
         return results
 
 
+def _to_resources(ids: List[ResourceId], unique_ids: List[ResourceId],
+                  resources_chunks: List[List[Resource]]) -> List[Resource]:
+    resources = list(itertools.chain.from_iterable(resources_chunks))
+    if len(unique_ids) == len(ids):
+        return resources
+
+    # Duplicated identifiers have been described once, distinct copies
+    # are returned for their other occurrences
+    resources_by_id = {resource.id: resource for resource in resources}
+    results = []
+    returned = set()
+    for resource_id in ids:
+        resource = resources_by_id.get(resource_id)
+        if resource is None:
+            continue
+        if resource_id in returned:
+            resource = copy_resource(resource)
+        returned.add(resource_id)
+        results.append(resource)
+    return results
+
+
+def describe_many(manager, *, url: str, ids_param: str, ids: List[ResourceId],
+                  **kwargs) -> List[Resource]:
+    """Generic function to describe a list of resources.
+
+    Duplicated identifiers are described once. The identifiers are
+    split in chunks of at most ``Provider.describe_chunk_size()`` elements,
+    the chunks being described concurrently (see ``Provider.post_describe``).
+
+    Args:
+        manager: Resource manager.
+
+        url: URL for the describe request.
+
+        ids_param: Name of the request parameter holding the identifiers.
+
+        ids: Identifiers of the resources to describe.
+
+        **kwargs: Optional keyword arguments. Those arguments are
+            passed as is to the API provider.
+
+    Returns:
+        The resource descriptions, in the order of ``ids``.
+
+    """
+    if not ids:
+        return []
+
+    provider = manager._provider
+    unique_ids = list(dict.fromkeys(ids))
+    chunk_size = provider.describe_chunk_size()
+    if len(unique_ids) <= chunk_size:
+        # Small lists fit in a single request
+        resources_chunks = [provider.post_describe(url, ids_param=ids_param, ids=unique_ids,
+                                                   data=kwargs, factory=Resource.from_dict)]
+    else:
+        ids_chunks = get_chunks(unique_ids, chunk_size)
+        resources_chunks = concurrent_map(
+            lambda ids_chunk: provider.post_describe(url, ids_param=ids_param, ids=ids_chunk,
+                                                     data=kwargs, factory=Resource.from_dict),
+            ids_chunks
+        )
+
+    return _to_resources(ids, unique_ids, resources_chunks)
+
+
+def describe_iter(manager, *, url: str, ids_param: str, ids: List[ResourceId],
+                  **kwargs) -> Generator[Resource, None, None]:
+    """Return a generator describing a list of resources chunk by chunk.
+
+    The next chunk of identifiers is described in the background while
+    the resources of the current chunk are yielded, chunks after it
+    being only described if the iteration goes on.
+
+    Args:
+        manager: Resource manager.
+
+        url: URL for the describe request.
+
+        ids_param: Name of the request parameter holding the identifiers.
+
+        ids: Identifiers of the resources to describe.
+
+        **kwargs: Optional keyword arguments. Those arguments are
+            passed as is to the API provider.
+
+    Returns:
+        A generator yielding the resource descriptions, in the order of ``ids``.
+
+    """
+    provider = manager._provider
+    ids_chunks = get_chunks(ids, provider.describe_chunk_size())
+
+    def describe_chunk(ids_chunk):
+        return provider.post_describe(url, ids_param=ids_param, ids=ids_chunk, data=kwargs,
+                                      factory=Resource.from_dict)
+
+    if len(ids_chunks) <= 1:
+        for ids_chunk in ids_chunks:
+            yield from describe_chunk(ids_chunk)
+        return
+
+    executor = get_executor()
+    next_resources = executor.submit(describe_chunk, ids_chunks[0])
+    try:
+        for next_ids_chunk in ids_chunks[1:] + [None]:
+            resources = next_resources.result()
+            if next_ids_chunk is not None:
+                next_resources = executor.submit(describe_chunk, next_ids_chunk)
+
+            yield from resources
+    finally:
+        next_resources.cancel()
+
+
+def describe_cache_key(resource_id: ResourceId, params: dict) -> Tuple[ResourceId, str]:
+    """Return the key of a resource description in a describe cache.
+
+    Args:
+        resource_id: Identifier of the described resource.
+
+        params: Extra parameters of the describe request.
+
+    Returns:
+        A key starting with ``resource_id``, so that all the cached
+        descriptions of a resource can be invalidated at once.
+
+    """
+    return resource_id, json.dumps(params, sort_keys=True, default=str)
+
+
+def copy_resource(resource: Resource) -> Resource:
+    """Return a deep copy of a resource.
+
+    Used to return cached resources, so that changes made to the
+    returned resource (including to its nested values) don't alter
+    the cached one.
+
+    Args:
+        resource: Resource to copy.
+
+    Returns:
+        The copy of ``resource``.
+
+    """
+    return Resource.from_dict(copy.deepcopy(vars(resource)))
+
+
+def describe_many_cached(manager, cache: TTLCache, *, url: str, ids_param: str,
+                         ids: List[ResourceId], **kwargs) -> List[Resource]:
+    """Same as ``describe_many``, only requesting resources missing from ``cache``.
+
+    The resources described are added to ``cache``. Returned resources
+    are deep copies of the cached ones. Duplicated identifiers are looked up
+    and described once. When ``cache`` is disabled, this is the same as
+    ``describe_many``.
+
+    """
+    if not cache.enabled:
+        return describe_many(manager, url=url, ids_param=ids_param, ids=ids, **kwargs)
+
+    resources = {resource_id: cache.get(describe_cache_key(resource_id, kwargs))
+                 for resource_id in ids}
+    missing_ids = [resource_id for resource_id, resource in resources.items()
+                   if resource is None]
+    if missing_ids:
+        for resource in describe_many(manager, url=url, ids_param=ids_param,
+                                      ids=missing_ids, **kwargs):
+            cache.set(describe_cache_key(resource.id, kwargs), resource)
+            resources[resource.id] = resource
+
+    return [copy_resource(resources[resource_id]) for resource_id in ids
+            if resources.get(resource_id) is not None]
+
+
+async def describe_many_async(manager, *, url: str, ids_param: str,
+                              ids: List[ResourceId], **kwargs) -> List[Resource]:
+    """Generic coroutine to describe a list of resources.
+
+    Same as ``describe_many`` except that the chunks requests are
+    awaited from the running event loop, the blocking calls to the
+    provider being run in the loop default executor.
+
+    Args:
+        manager: Resource manager.
+
+        url: URL for the describe request.
+
+        ids_param: Name of the request parameter holding the identifiers.
+
+        ids: Identifiers of the resources to describe.
+
+        **kwargs: Optional keyword arguments. Those arguments are
+            passed as is to the API provider.
+
+    Returns:
+        The resource descriptions, in the order of ``ids``.
+
+    """
+    if not ids:
+        return []
+
+    import asyncio
+
+    loop = get_running_loop()
+    provider = manager._provider
+    unique_ids = list(dict.fromkeys(ids))
+    resources_chunks = await asyncio.gather(*(
+        loop.run_in_executor(None, functools.partial(provider.post_describe, url,
+                                                     ids_param=ids_param, ids=ids_chunk,
+                                                     data=kwargs, factory=Resource.from_dict))
+        for ids_chunk in get_chunks(unique_ids, provider.describe_chunk_size())
+    ))
+
+    return _to_resources(ids, unique_ids, resources_chunks)
+
+
+def create_many(manager, *, items: List[dict]) -> List[Resource]:
+    """Generic bulk creation function.
+
+    The manager ``create`` method is called concurrently for each item.
+
+    Args:
+        manager: Resource manager.
+
+        items: Keyword arguments of the manager ``create`` method, one
+            dictionary per resource to create.
+
+    Returns:
+        The created resources, in the order of ``items``.
+
+    """
+    return concurrent_map(lambda item: manager.create(**item), items)
+
+
 def search_generator(manager, *,
                      page: int = None, first_page: int,
                      filter: dict = None, fields: dict = None,
                      limit: int = 50, sort: Optional[Dict[str, int]] = None,
                      keyset_pagination: bool = False,
+                     prefetch: bool = False,
                      **kwargs) -> Generator[Resource, None, None]:
     """Return a generator to search through the given manager resources.
 
@@ -108,6 +352,9 @@ def search_generator(manager, *,
 
         keyset_pagination: Optional search using keyset pagination.
 
+        prefetch: Optional. If ``True``, the next page is requested in the
+            background while the resources of the current page are
+            yielded (default to ``False``).
 
         **kwargs: Optional keyword arguments. Those arguments are
             passed as is to the API provider.
@@ -162,11 +409,25 @@ def search_generator(manager, *,
         def next_filter(resources):
             return filter
 
-    resources = None
-    while resources is None or len(resources) > 0:
-        resources = manager.search(filter=next_filter(resources), **data)
-        for resource in resources:
-            yield resource
-
-        if not keyset_pagination:
-            data['page'] += 1
+    executor = get_executor() if prefetch else None
+    next_resources = None
+    try:
+        resources = None
+        while resources is None or len(resources) > 0:
+            if next_resources is None:
+                resources = manager.search(filter=next_filter(resources), **data)
+            else:
+                resources = next_resources.result()
+
+            if not keyset_pagination:
+                data['page'] += 1
+
+            if executor is not None and len(resources) > 0:
+                next_resources = executor.submit(manager.search,
+                                                 filter=next_filter(resources), **data)
+
+            for resource in resources:
+                yield resource
+    finally:
+        if next_resources is not None:
+            next_resources.cancel()
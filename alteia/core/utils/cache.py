@@ -0,0 +1,71 @@
+"""In-memory caching helpers.
+
+"""
+
+import collections
+import threading
+import time
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """Thread-safe least recently used cache whose entries expire.
+
+    """
+    def __init__(self, *, ttl: float = 60.0, max_size: int = 1024):
+        """Initializes an empty cache.
+
+        Args:
+            ttl: Optional time to live of the entries, in seconds
+                (default to 60). Nothing is cached when it is 0.
+
+            max_size: Optional maximum number of entries, the least
+                recently used ones being evicted first (default to 1024).
+
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are cached (``ttl`` is positive)."""
+        return self._ttl > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expiration, value = entry
+            if expiration < time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        """Remove the entries whose key is ``key``, or a tuple starting with ``key``."""
+        with self._lock:
+            for k in [k for k in self._entries
+                      if k == key or (isinstance(k, tuple) and k and k[0] == key)]:
+                del self._entries[k]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
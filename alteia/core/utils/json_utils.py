@@ -0,0 +1,69 @@
+"""JSON encoding and decoding helpers.
+
+``orjson`` is used when installed (``fast-json`` extra), the standard
+``json`` module otherwise.
+
+"""
+
+import json
+from typing import Any, Union
+
+_orjson: Any = None
+_orjson_resolved = False
+
+
+def _get_orjson():
+    global _orjson, _orjson_resolved
+    if not _orjson_resolved:
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        _orjson = orjson
+        _orjson_resolved = True
+    return _orjson
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to a compact JSON document encoded in UTF-8.
+
+    With ``orjson``, some types unsupported by the ``json`` module are
+    serialized natively (e.g. ``datetime`` as RFC 3339 strings,
+    ``UUID`` or dataclasses).
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        The JSON document.
+
+    """
+    orjson = _get_orjson()
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # Not supported by orjson (e.g. integer over 64 bits or
+            # non-string key), let the standard module handle it
+            pass
+    try:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    except UnicodeEncodeError:
+        # Lone surrogates can't be encoded to UTF-8, keep them escaped
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: JSON document, as text or encoded in UTF-8.
+
+    Returns:
+        The deserialized object.
+
+    """
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,14 +1,38 @@
+import atexit
 import collections
+import concurrent.futures as cf
+import functools
 import hashlib
 import importlib
+import threading
 from datetime import datetime
 from getpass import getpass
 from math import floor, log
-from typing import List, Optional
+from typing import Callable, FrozenSet, Iterable, List, Optional
 
+from alteia.core.connection.async_connection import MAX_REQUESTS_WORKERS
 from alteia.core.errors import ConfigError
 
 BLOCK_SIZE = 4096
+_HASH_BLOCK_SIZE = 1024 ** 2  # large reads to hash files
+
+_executor: Optional[cf.ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+_SPECIAL_CHARS_TABLE = {ord(c): None for c in '$.'}
+
+
+def _has_special_chars(key) -> bool:
+    if isinstance(key, bytes):
+        return b'$' in key or b'.' in key
+    return '$' in key or '.' in key
+
+
+@functools.lru_cache(maxsize=1024)
+def _has_keys_to_sanitize(keys: FrozenSet) -> bool:
+    # Cached by set of keys since payloads often repeat the same shape
+    return any(_has_special_chars(key) for key in keys)
 
 
 def sanitize_dict(value):
@@ -23,10 +47,17 @@ def sanitize_dict(value):
 
     """
     if isinstance(value, dict):
+        if not _has_keys_to_sanitize(frozenset(value)):
+            # Nothing to rename, keep the keys (and their order) as is
+            for item in value.values():
+                if isinstance(item, (dict, list)):
+                    sanitize_dict(item)
+            return value
+
         original_keys = [key for key in value.keys()]
         for key in original_keys:
             try:
-                cleaned = key.translate({ord(c): None for c in '$.'})
+                cleaned = key.translate(_SPECIAL_CHARS_TABLE)
             except TypeError:
                 cleaned = key.translate(None,
                                         '$.')  # Note that translate() signature changes with key  # type but one  #
@@ -44,9 +75,12 @@ def md5(file_path):
     md5sum of the object
     used for uploads
     """
-    object_hash = hashlib.md5()
     with open(file_path, 'rb') as fstr:
-        for chunk in iter(lambda: fstr.read(BLOCK_SIZE), b''):
+        if hasattr(hashlib, 'file_digest'):  # Python >= 3.11
+            return hashlib.file_digest(fstr, 'md5').hexdigest()
+
+        object_hash = hashlib.md5()
+        for chunk in iter(lambda: fstr.read(_HASH_BLOCK_SIZE), b''):
             object_hash.update(chunk)
     return object_hash.hexdigest()
 
@@ -56,9 +90,7 @@ def md5_from_blob(blob):
     md5sum of the object
     used for uploads
     """
-    object_hash = hashlib.md5()
-    object_hash.update(blob)
-    return object_hash.hexdigest()
+    return hashlib.md5(blob).hexdigest()
 
 
 def new_instance(module_path, class_name, **kwargs):
@@ -198,3 +230,51 @@ def human_bytes(bytes_value, digits: int = None, si=False, power_max=5) -> str:
 def get_chunks(lst: list, max_per_chunk: int) -> List[list]:
     """make chunks from a list with max elements per chunk"""
     return [lst[i:i + max_per_chunk] for i in range(0, len(lst), max_per_chunk)]
+
+
+def get_executor() -> cf.ThreadPoolExecutor:
+    """Return the pool of threads shared by the concurrent requests.
+
+    The pool is created on first use, with ``MAX_REQUESTS_WORKERS``
+    workers, and shut down at interpreter exit.
+
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = cf.ThreadPoolExecutor(max_workers=MAX_REQUESTS_WORKERS,
+                                                  thread_name_prefix='alteia')
+                atexit.register(_executor.shutdown, wait=False)
+    return _executor
+
+
+def get_running_loop():
+    """Return the event loop running the current coroutine.
+
+    ``asyncio.get_running_loop()`` is only available from Python 3.7,
+    ``asyncio.get_event_loop()`` is used on older versions.
+
+    """
+    import asyncio
+
+    if hasattr(asyncio, 'get_running_loop'):
+        return asyncio.get_running_loop()
+    return asyncio.get_event_loop()
+
+
+def concurrent_map(func: Callable, items: Iterable) -> list:
+    """Apply ``func`` to every item using the shared pool of threads.
+
+    Meant for independent, I/O-bound calls (e.g. API requests). The
+    results are returned in the order of ``items``; the first raised
+    exception is propagated. When called from a thread of the pool
+    itself, the calls are made sequentially, since waiting for other
+    tasks of the pool from one of its threads may deadlock.
+
+    """
+    items = list(items)
+    if len(items) <= 1 or threading.current_thread().name.startswith('alteia_'):
+        return [func(item) for item in items]
+
+    return list(get_executor().map(func, items))
@@ -99,7 +99,8 @@ def _create_connection(config: ConnectionConfig,
         conn_opts.update({'proxy_url': config.proxy_url})
 
     if config.connection is not None:
-        for key in ('disable_ssl_certificate', 'max_retries'):
+        for key in ('disable_ssl_certificate', 'max_retries', 'pool_maxsize',
+                    'etag_cache_size'):
             if key in config.connection:
                 conn_opts.update({key: config.connection[key]})
 
@@ -233,11 +234,15 @@ class SDK():
         if not token.access_token or not token.token_type:
             self._connection._renew_token()
 
-        self.__set_providers()
+        self.__set_providers(connection_config)
         self.__set_resources_as_attributes()
 
-    def __set_providers(self):
+    def __set_providers(self, config: ConnectionConfig):
         provider_args = {'connection': self._connection}
+        if config.connection is not None:
+            for key in ('describe_cache_ttl', 'compress_min_size'):
+                if key in config.connection:
+                    provider_args[key] = config.connection[key]
         self._providers = {
             'analytics_service_api': AnalyticsServiceAPI(**provider_args),
             'annotations_api': AnnotationsAPI(**provider_args),
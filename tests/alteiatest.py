@@ -1,3 +1,4 @@
+import json
 from logging.config import fileConfig
 from unittest import TestCase
 from unittest.mock import Mock, call
@@ -17,6 +18,15 @@ class AlteiaTestBase(TestCase):
         fileConfig(resource_filename(__name__, 'logging-test.conf'),
                    disable_existing_loggers=False)
 
+    def assertJSONEqual(self, first, second, msg=None):
+        """Test that ``first`` and ``second`` are equal JSON documents.
+
+        Documents are compared once decoded, so that the formatting
+        of the encoder (whitespaces, bytes or text) does not matter.
+
+        """
+        self.assertEqual(json.loads(first), json.loads(second), msg)
+
     def assertEqualCoordinates(self, a, b, places=7, msg=None,
                                delta=None):
         """Test that ``a`` and ``b`` are almost equal lists of numbers.
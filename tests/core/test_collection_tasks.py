@@ -30,7 +30,7 @@ class TestCollectionTasks(ResourcesTestBase):
 
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, "/dct-service/task/set-task-status")
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body, '{"task": "task-id-1", "status": "scheduled"}'
         )
 
@@ -48,7 +48,7 @@ class TestCollectionTasks(ResourcesTestBase):
 
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, "/dct-service/task/describe-task")
-        self.assertEqual(calls[0].request.body, '{"task": "task-id-1"}')
+        self.assertJSONEqual(calls[0].request.body, '{"task": "task-id-1"}')
 
     @responses.activate
     def test_describe_multiple_collection_task(self):
@@ -64,7 +64,7 @@ class TestCollectionTasks(ResourcesTestBase):
 
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, "/dct-service/task/describe-tasks")
-        self.assertEqual(calls[0].request.body, '{"tasks": ["task-id-1", "task-id-2"]}')
+        self.assertJSONEqual(calls[0].request.body, '{"tasks": ["task-id-1", "task-id-2"]}')
 
     @responses.activate
     def test_describe_multiple_collection_task_with_fields(self):
@@ -82,7 +82,7 @@ class TestCollectionTasks(ResourcesTestBase):
 
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, "/dct-service/task/describe-tasks")
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"fields": {"include": ["requirement"]}, "tasks": ["task-id-1", "task-id-2"]}',
         )
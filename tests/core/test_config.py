@@ -2,6 +2,7 @@ import json
 import os.path
 from unittest import mock
 
+from alteia.core import config
 from alteia.core.config import ConnectionConfig
 from tests.alteiatest import AlteiaTestBase
 
@@ -28,6 +29,12 @@ class TestConnectionConfig(AlteiaTestBase):
         self.assertEqual(conf.url, 'https://app.alteia.com')
         self.assertEqual(conf.connection['disable_ssl_certificate'], True)
 
+    def test_default_conf_dir(self):
+        """Test the default configuration directory is still exposed."""
+        self.assertTrue(config.DEFAULT_CONF_DIR.endswith('alteia'))
+        with self.assertRaises(AttributeError):
+            config.UNKNOWN_ATTRIBUTE
+
     def test_complete_custom_config(self):
         """Test loading a complete custom configuration."""
         conf_path = os.path.join(os.path.dirname(__file__),
@@ -5,11 +5,13 @@
 import json
 import unittest
 from unittest.mock import MagicMock, patch
+from urllib.parse import urljoin
 
 import urllib3
 
 from alteia.core.connection.abstract_connection import DEFAULT_USER_AGENTS
-from alteia.core.connection.connection import AsyncConnection, Connection
+from alteia.core.connection.connection import (MAX_REQUESTS_WORKERS,
+                                               AsyncConnection, Connection)
 from alteia.core.connection.credentials import ClientCredentials
 from alteia.core.connection.token import TokenManager
 from alteia.core.errors import ResponseError
@@ -55,10 +57,12 @@ class TestConnection(AlteiaTestBase):
 
         mocked_req.clear()
         mocked_req.return_value.data = '{"key": "value"}'.encode('utf-8')
+        custom_headers = {'Custom-Header': 'Test'}
         resp_data = self.conn.post('other', data='data to send',
-                                   headers={'Custom-Header': 'Test'},
+                                   headers=custom_headers,
                                    timeout=15.0, as_json=True)
         self.assertDictEqual(resp_data, {'key': 'value'})
+        self.assertEqual(custom_headers, {'Custom-Header': 'Test'})
         self.assertEqual(mocked_req.call_count, 2)
         call_args = mocked_req.call_args[1]
         del call_args['retries']
@@ -80,6 +84,7 @@ class TestConnection(AlteiaTestBase):
             self.conn.post('/path')
 
         mocked_req.assert_called_once()
+        mocked_req.return_value.release_conn.assert_called_once()
 
     def test_get(self, mocked_req):
         """Test GET."""
@@ -141,6 +146,28 @@ class TestConnection(AlteiaTestBase):
         resp_data = self.conn.get('/path')
         self.assertEqual(resp_data, 'received data')
         self.assertEqual(mocked_req.call_count, 3)
+        values[0].drain_conn.assert_called_once()
+        self.assertEqual(mocked_req.call_args[1]['headers']['Authorization'],
+                         'Bearer y77ceIHcPu2RKHo9clekkG8B')
+        self.assertEqual(self.conn._token_manager.authorization,
+                         'Bearer y77ceIHcPu2RKHo9clekkG8B')
+
+    def test_post_with_expired_token(self, mocked_req):
+        """Test the request body is sent as is when retrying with a new token."""
+        token_post_resp = {'access_token': 'y77ceIHcPu2RKHo9clekkG8B',
+                           'expires_in': 14400,
+                           'refresh_token': '0PPCsHkBesbVC2FJpV8eqaXB',
+                           'token_type': 'Bearer'}
+        mocked_req.side_effect = [MagicMock(status=401, data=''),
+                                  MagicMock(status=200,
+                                            data=json.dumps(token_post_resp).encode('utf-8')),
+                                  MagicMock(status=200, data='received data')]
+
+        body = b'{"key":"value"}'
+        self.conn.post('/path', data=body)
+        first_call, _, retry_call = mocked_req.call_args_list
+        self.assertIs(first_call[1]['body'], body)
+        self.assertIs(retry_call[1]['body'], body)
 
     def test_lazy_get(self, mocked_req):
         """Test lazy GET."""
@@ -244,6 +271,80 @@ class TestConnection(AlteiaTestBase):
 
         mocked_req.assert_called_once()
 
+    def test_pool_maxsize(self, *args):
+        """Test the size of the pool of kept-alive connections."""
+        self.assertEqual(self.conn._http.connection_pool_kw['maxsize'],
+                         MAX_REQUESTS_WORKERS)
+
+        conn = Connection(base_url='https://app.alteia.com', access_token='token',
+                          pool_maxsize=20)
+        self.assertEqual(conn._http.connection_pool_kw['maxsize'], 20)
+        self.assertFalse(conn._http.connection_pool_kw['block'])
+        self.assertIs(conn.asynchronous._http, conn._http)
+
+    def test_async_put_headers(self, mocked_req):
+        """Test asynchronous PUT does not modify the given headers."""
+        mocked_req.return_value = MagicMock(status=200, data='received data')
+        conn = Connection(base_url='https://app.alteia.com', access_token='token')
+        headers = {'Content-Type': 'application/octet-stream'}
+
+        conn.asynchronous.put('/path', headers=headers).result()
+
+        self.assertDictEqual(headers, {'Content-Type': 'application/octet-stream'})
+        sent_headers = mocked_req.call_args[1]['headers']
+        self.assertEqual(sent_headers['Content-Type'], 'application/octet-stream')
+        self.assertIn('Authorization', sent_headers)
+
+    def test_retries_backoff(self, *args):
+        """Test the retries backoff is jittered and kept on new retries."""
+        retries = self.conn.retries
+        self.assertFalse(retries.raise_on_status)
+        self.assertEqual(retries.get_backoff_time(), 0)
+
+        for _ in range(3):
+            retries = retries.increment(method='GET', url='/', response=MagicMock(
+                status=503, get_redirect_location=MagicMock(return_value=False)))
+        backoff = retries.get_backoff_time()
+        self.assertGreaterEqual(backoff, 0.3 * 4)
+        self.assertLessEqual(backoff, 0.3 * 4 + 0.5)
+        self.assertIs(type(retries), type(self.conn.retries))
+
+    def test_etag_cache(self, mocked_req):
+        """Test GET responses revalidation with their ETag."""
+        conn = Connection(base_url='https://app.alteia.com', access_token='token',
+                          etag_cache_size=8)
+        mocked_req.return_value = MagicMock(status=200, data=b'{"key": "value"}',
+                                            headers={'ETag': '"v1"'})
+        self.assertEqual(conn.get('path', as_json=True), {'key': 'value'})
+        self.assertNotIn('If-None-Match', mocked_req.call_args[1]['headers'])
+
+        mocked_req.return_value = MagicMock(status=304, data=b'', headers={})
+        self.assertEqual(conn.get('path', as_json=True), {'key': 'value'})
+        self.assertEqual(mocked_req.call_args[1]['headers']['If-None-Match'], '"v1"')
+
+        with self.assertRaises(ResponseError):
+            self.conn.get('path')
+
+    def test_build_url(self, *args):
+        """Test request URLs match the URLs joined with urljoin()."""
+        paths = ('data-manager/describe-datasets', 'tags?project_id=a:b', '/dxauth/oauth/token',
+                 'a/../b', './a', 'a//b', '', '?a=1', 'https://example.org/a', 'mailto:a')
+        for base_url in ('https://app.alteia.com', 'https://app.alteia.com/api/'):
+            conn = Connection(base_url=base_url, access_token='token')
+            for path in paths:
+                self.assertEqual(conn._build_url(path), urljoin(conn._base_url, path), path)
+
+    def test_authorization_host(self, *args):
+        """Test the authorization header is only sent to the API host."""
+        conn = Connection(base_url='https://app.alteia.com', access_token='token')
+        for url, expected in (('https://app.alteia.com/path', True),
+                              ('https://app.alteia.com?query', True),
+                              ('https://app.alteia.com.example.org/path', False),
+                              ('https://example.org/path', False)):
+            headers = {}
+            conn._add_authorization_maybe(headers, url)
+            self.assertEqual('Authorization' in headers, expected, url)
+
     def test_user_agent(self, *args):
         """Test playing with User-Agent"""
 
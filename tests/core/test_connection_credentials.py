@@ -1,4 +1,5 @@
 import base64
+import json
 
 from alteia.core.connection.credentials import (ClientCredentials,
                                                 UserCredentials)
@@ -17,6 +18,8 @@ class TestClientCredentials(AlteiaTestBase):
         client_id, client_secret = decoded_secret.split(':')
         self.assertEqual(client_id, '5aabc6df52e3ea3a3bd57a47')
         self.assertEqual(client_secret, 'thesecret')
+        self.assertEqual(creds.authorization, f'Basic {creds.encoded_secret}')
+        self.assertEqual(json.loads(creds.serialized_data), creds.data)
 
 
 class TestUserCredentials(AlteiaTestBase):
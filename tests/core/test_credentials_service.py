@@ -107,7 +107,7 @@ class TestCredentials(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/credentials-service/search-credentials"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"filter": {"company": {"$eq": "507f191e810c19729de860eb"},'
             ' "name": {"$eq": "Docker registry production"}}}',
@@ -141,7 +141,7 @@ class TestCredentials(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/credentials-service/create-credentials"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"name": "Docker registry", "company": "507f191e810c19729de860eb",'
             ' "credentials": {"type": "docker", "login": "login_test", "password": "password_test"},'
@@ -178,7 +178,7 @@ class TestCredentials(ResourcesTestBase):
             calls[0].request.url, "/credentials-service/create-credentials"
         )
 
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"name": "aws s3", "company": "507f191e810c19729de860eb",'
             ' "credentials": {"type": "s3", "aws_access_key_id": "key_id", "aws_secret_access_key": "password_test",'
@@ -216,7 +216,7 @@ class TestCredentials(ResourcesTestBase):
             calls[0].request.url, "/credentials-service/create-credentials"
         )
 
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"name": "up-42", "company": "507f191e810c19729de860eb",'
             ' "credentials": {"type": "oauth", "token_url": "https://api.up42.com/oauth/token",'
@@ -248,7 +248,7 @@ class TestCredentials(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/credentials-service/create-credentials"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"name": "Docker registry", "company": "507f191e810c19729de860eb",'
             ' "credentials": {"login": "login_test", "password": "password_test"}}',
@@ -280,7 +280,7 @@ class TestCredentials(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/credentials-service/create-credentials"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"name": "Docker registry", "company": "507f191e810c19729de860eb",'
             ' "credentials": {"login": "login_test", "password": "password_test"},'
@@ -313,7 +313,7 @@ class TestCredentials(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/credentials-service/create-credentials"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"name": "Docker registry", "company": "507f191e810c19729de860eb",'
             ' "credentials": {"login": "login_test", "password": "password_test"},'
@@ -347,7 +347,7 @@ class TestCredentials(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/credentials-service/create-credentials"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"name": "aws s3", "company": "507f191e810c19729de860eb",'
             ' "credentials": {"aws_access_key_id": "key_id", "aws_secret_access_key": "password_test",'
@@ -381,7 +381,7 @@ class TestCredentials(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/credentials-service/create-credentials"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"name": "up-42", "company": "507f191e810c19729de860eb",'
             ' "credentials": {"token_url": "https://api.up42.com/oauth/token",'
@@ -407,7 +407,7 @@ class TestCredentials(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/credentials-service/delete-credentials"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"company": "507f191e810c19729de860eb", "credentials": "63317316dfaf18df1b77f42f"}',
         )
@@ -437,7 +437,7 @@ class TestCredentials(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/credentials-service/set-credentials"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"company": "507f191e810c19729de860ea", "name": "Docker registry",'
             ' "credentials": {"type": "docker", "login": "login_test", "password": "password_test",'
@@ -468,7 +468,7 @@ class TestCredentials(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/credentials-service/set-labels"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"company": "507f191e810c19729de860ea", "name": "Docker registry",'
             ' "labels": {"label1": "value1", "label2": "value2", "label3": "value3"}}',
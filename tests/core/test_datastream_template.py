@@ -112,7 +112,7 @@ class TestDatastreamTemplate(ResourcesTestBase):
 
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, "/dataflow/create-datastream-template")
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"description": "description", "aggregate": {"type": "", "parameters": {}, "strategy": {}},'
             ' "company": "507f191e810c19729de860eb", "contextualisation": {"type": "geographic", "parameters":'
@@ -143,7 +143,7 @@ class TestDatastreamTemplate(ResourcesTestBase):
         )
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, "/dataflow/create-datastream-template")
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"description": "description", "aggregate": {"type": "", "parameters": {}, "strategy": {}},'
             ' "company": "507f191e810c19729de860eb", "contextualisation": {"type": "geographic",'
@@ -172,7 +172,7 @@ class TestDatastreamTemplate(ResourcesTestBase):
 
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, "/dataflow/create-datastream-template")
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"description": "description", "aggregate": {"type": "", "parameters": {}, "strategy": {}},'
             ' "company": "507f191e810c19729de860eb", "transform": {"analytic": {"name": "datastream",'
@@ -198,7 +198,7 @@ class TestDatastreamTemplate(ResourcesTestBase):
         )
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, "/dataflow/create-datastream-template")
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"description": "description", "aggregate": {"type": "", "parameters": {}, "strategy": {}},'
             ' "company": "507f191e810c19729de860eb", "name": "My datastream", "source":'
@@ -225,7 +225,7 @@ class TestDatastreamTemplate(ResourcesTestBase):
 
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, "/dataflow/search-datastream-templates")
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"filter": {"company": {"$eq": "507f191e810c19729de860eb"},'
             ' "name": {"$match": "My datastream"}}, "limit": 100}',
@@ -246,7 +246,7 @@ class TestDatastreamTemplate(ResourcesTestBase):
 
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, "/dataflow/delete-datastream-template")
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"datastreamtemplate": "507f191e810c19729de860eb"}',
         )
@@ -267,7 +267,7 @@ class TestDatastreamTemplate(ResourcesTestBase):
 
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, "/dataflow/describe-datastream-template")
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"datastreamtemplate": "507f191e810c19729de860eb"}',
         )
@@ -290,7 +290,7 @@ class TestDatastreamTemplate(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/dataflow/describe-datastream-templates"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"datastreamtemplates": ["507f191e810c19729de860eb"]}',
         )
@@ -0,0 +1,31 @@
+import json
+
+from urllib3_mock import Responses
+
+from alteia.core.errors import ResponseError
+from tests.core.resource_test_base import ResourcesTestBase
+
+responses = Responses()
+
+
+class TestFields(ResourcesTestBase):
+
+    def __describe_field(self, request):
+        field = json.loads(request.body)['field']
+        if field != 'field-id':
+            return 404, None, json.dumps({'message': 'Not found'})
+        return 200, None, json.dumps({'_id': field})
+
+    @responses.activate
+    def test_describe_single_element_list(self):
+        responses.add_callback('POST', '/season-planner/asset-management/describe-field',
+                               callback=self.__describe_field,
+                               content_type='application/json')
+
+        fields = self.sdk.fields.describe(['field-id'])
+        self.assertEqual([field.id for field in fields], ['field-id'])
+
+        self.assertEqual(self.sdk.fields.describe(['unknown-id']), [])
+        with self.assertRaises(ResponseError):
+            self.sdk.fields.describe('unknown-id')
+        self.assertEqual(len(responses.calls), 3)
@@ -30,7 +30,7 @@ class TestFlights(ResourcesTestBase):
         self.sdk.flights.search(filter={'project': {'$eq': 'project-id'}}, sort={'_id': -1})
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, '/project-manager/search-flights')
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"filter": {"project": {"$eq": "project-id"}}, "limit": 100, "sort": {"_id": -1}}'
         )
@@ -38,8 +38,8 @@ class TestFlights(ResourcesTestBase):
         self.sdk.flights.search(filter={'mission': {'$eq': 'mission-id'}}, limit=50)
         self.assertEqual(len(calls), 2)
         self.assertEqual(calls[1].request.url, '/project-manager/search-flights')
-        self.assertEqual(calls[1].request.body,
-                         '{"filter": {"mission": {"$eq": "mission-id"}}, "limit": 50}')
+        self.assertJSONEqual(calls[1].request.body,
+                             '{"filter": {"mission": {"$eq": "mission-id"}}, "limit": 50}')
 
     @staticmethod
     def __search_post_response():
@@ -70,14 +70,14 @@ class TestFlights(ResourcesTestBase):
         result_one = self.sdk.flights.describe('flight-id')
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, '/project-manager/describe-flight')
-        self.assertEqual(calls[0].request.body, '{"flight": "flight-id"}')
+        self.assertJSONEqual(calls[0].request.body, '{"flight": "flight-id"}')
         self.assertTrue(isinstance(result_one, Resource))
         assert result_one.id == 'flight-id'
 
         result_many = self.sdk.flights.describe(['flight-id-1', 'flight-id-2'])
         self.assertEqual(len(calls), 2)
         self.assertEqual(calls[1].request.url, '/project-manager/describe-flights')
-        self.assertEqual(calls[1].request.body, '{"flights": ["flight-id-1", "flight-id-2"]}')
+        self.assertJSONEqual(calls[1].request.body, '{"flights": ["flight-id-1", "flight-id-2"]}')
         self.assertTrue(isinstance(result_many, list))
         self.assertTrue(isinstance(result_many[0], Resource))
         assert result_many[0].id == 'flight-id-1'
@@ -96,7 +96,7 @@ class TestFlights(ResourcesTestBase):
         self.assertEqual(len(calls), 1)
 
         self.assertEqual(calls[0].request.url, '/project-manager/update-flight-name')
-        self.assertEqual(calls[0].request.body, '{"flight": "flight-id", "name": "new-name"}')
+        self.assertJSONEqual(calls[0].request.body, '{"flight": "flight-id", "name": "new-name"}')
 
         assert flight.id == 'flight-id'
         assert flight.name == 'new-name'
@@ -118,7 +118,7 @@ class TestFlights(ResourcesTestBase):
         self.assertEqual(len(calls), 1)
 
         self.assertEqual(calls[0].request.url, '/project-manager/update-flight-status')
-        self.assertEqual(calls[0].request.body, '{"flight": "flight-id", "status": "completed"}')
+        self.assertJSONEqual(calls[0].request.body, '{"flight": "flight-id", "status": "completed"}')
 
         assert flight.id == 'flight-id'
         assert flight.status == 'completed'
@@ -151,7 +151,7 @@ class TestMissions(ResourcesTestBase):
         self.sdk.missions.search(filter={'_id': {'$in': ['mission-id']}}, sort={'_id': -1})
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, '/project-manager/search-missions')
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"filter": {"_id": {"$in": ["mission-id"]}}, "limit": 100, "sort": {"_id": -1}}'
         )
@@ -159,8 +159,8 @@ class TestMissions(ResourcesTestBase):
         self.sdk.missions.search(filter={'project': {'$eq': 'project-id'}}, limit=50)
         self.assertEqual(len(calls), 2)
         self.assertEqual(calls[1].request.url, '/project-manager/search-missions')
-        self.assertEqual(calls[1].request.body,
-                         '{"filter": {"project": {"$eq": "project-id"}}, "limit": 50}')
+        self.assertJSONEqual(calls[1].request.body,
+                             '{"filter": {"project": {"$eq": "project-id"}}, "limit": 50}')
 
     @responses.activate
     def test_delete(self):
@@ -176,7 +176,7 @@ class TestMissions(ResourcesTestBase):
         self.assertEqual(len(calls), 1)
 
         self.assertEqual(calls[0].request.url, '/project-manager/missions/delete-survey')
-        self.assertEqual(calls[0].request.body, '{"mission": "mission_id"}')
+        self.assertJSONEqual(calls[0].request.body, '{"mission": "mission_id"}')
 
     @staticmethod
     def __create_mission_post_response():
@@ -224,14 +224,14 @@ class TestMissions(ResourcesTestBase):
         result_one = self.sdk.missions.describe('mission-id')
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, '/project-manager/describe-mission')
-        self.assertEqual(calls[0].request.body, '{"mission": "mission-id"}')
+        self.assertJSONEqual(calls[0].request.body, '{"mission": "mission-id"}')
         self.assertTrue(isinstance(result_one, Resource))
         assert result_one.id == 'mission-id'
 
         result_many = self.sdk.missions.describe(['mission-id-1', 'mission-id-2'])
         self.assertEqual(len(calls), 2)
         self.assertEqual(calls[1].request.url, '/project-manager/describe-missions')
-        self.assertEqual(calls[1].request.body, '{"missions": ["mission-id-1", "mission-id-2"]}')
+        self.assertJSONEqual(calls[1].request.body, '{"missions": ["mission-id-1", "mission-id-2"]}')
         self.assertTrue(isinstance(result_many, list))
         self.assertTrue(isinstance(result_many[0], Resource))
         assert result_many[0].id == 'mission-id-1'
@@ -250,7 +250,7 @@ class TestMissions(ResourcesTestBase):
         self.assertEqual(len(calls), 1)
 
         self.assertEqual(calls[0].request.url, '/project-manager/update-mission-name')
-        self.assertEqual(calls[0].request.body, '{"mission": "mission-id", "name": "new-name"}')
+        self.assertJSONEqual(calls[0].request.body, '{"mission": "mission-id", "name": "new-name"}')
 
         assert mission.id == 'mission-id'
         assert mission.name == 'new-name'
@@ -38,7 +38,7 @@ class TestPilots(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/dct-service/asset-management/describe-pilot"
         )
-        self.assertEqual(calls[0].request.body, '{"pilot": "pilot-id-1"}')
+        self.assertJSONEqual(calls[0].request.body, '{"pilot": "pilot-id-1"}')
 
     @responses.activate
     def test_multiple_pilot_describe(self):
@@ -56,7 +56,7 @@ class TestPilots(ResourcesTestBase):
         self.assertEqual(
             calls[0].request.url, "/dct-service/asset-management/describe-pilots"
         )
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body, '{"pilots": ["pilot-id-1", "pilot-id-2"]}'
         )
 
@@ -56,6 +56,25 @@ class TestProjects(ResourcesTestBase):
                               'company': 'COMPANY_ID',
                               'arg2': 10})
 
+    @responses.activate
+    def test_create_many(self):
+        responses.add('POST', '/project-manager/projects',
+                      body=self.__legacy_describe(), status=200,
+                      content_type='application/json')
+
+        projects = self.sdk.projects.create_many(names=['Project 1', 'Project 2'],
+                                                 company='COMPANY_ID')
+
+        calls = responses.calls
+
+        # test responses
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(projects), 2)
+        self.assertCountEqual([json.loads(c.request.body)['name'] for c in calls],
+                              ['Project 1', 'Project 2'])
+        for c in calls:
+            self.assertEqual(json.loads(c.request.body)['company'], 'COMPANY_ID')
+
     @responses.activate
     def test_search_without_error(self):
         responses.add('POST', '/project-manager/search-projects',
@@ -66,7 +85,7 @@ class TestProjects(ResourcesTestBase):
         self.sdk.projects.search(filter={'_id': {'$in': ['project-id']}}, sort={'_id': -1})
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, '/project-manager/search-projects')
-        self.assertEqual(
+        self.assertJSONEqual(
             calls[0].request.body,
             '{"filter": {"_id": {"$in": ["project-id"]}}, "limit": 100, "sort": {"_id": -1}}'
         )
@@ -74,14 +93,14 @@ class TestProjects(ResourcesTestBase):
         self.sdk.projects.search(filter={'search': {'$match': 'Debug project'}}, limit=50)
         self.assertEqual(len(calls), 2)
         self.assertEqual(calls[1].request.url, '/project-manager/search-projects')
-        self.assertEqual(calls[1].request.body,
-                         '{"filter": {"search": {"$match": "Debug project"}}, "limit": 50}')
+        self.assertJSONEqual(calls[1].request.body,
+                             '{"filter": {"search": {"$match": "Debug project"}}, "limit": 50}')
 
         self.sdk.projects.search(filter={'deletion_date': {'$exists': True}})
         self.assertEqual(len(calls), 3)
         self.assertEqual(calls[2].request.url, '/project-manager/search-projects')
-        self.assertEqual(calls[2].request.body,
-                         '{"filter": {"deletion_date": {"$exists": true}}, "limit": 100}')
+        self.assertJSONEqual(calls[2].request.body,
+                             '{"filter": {"deletion_date": {"$exists": true}}, "limit": 100}')
 
     @staticmethod
     def __search_post_response():
@@ -118,14 +137,14 @@ class TestProjects(ResourcesTestBase):
         result_one = self.sdk.projects.describe('project-id')
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, '/project-manager/describe-project')
-        self.assertEqual(calls[0].request.body, '{"project": "project-id"}')
+        self.assertJSONEqual(calls[0].request.body, '{"project": "project-id"}')
         self.assertTrue(isinstance(result_one, Resource))
         assert result_one.id == 'project-id'
 
         result_many = self.sdk.projects.describe(['project-id-1', 'project-id-2'])
         self.assertEqual(len(calls), 2)
         self.assertEqual(calls[1].request.url, '/project-manager/describe-projects')
-        self.assertEqual(calls[1].request.body, '{"projects": ["project-id-1", "project-id-2"]}')
+        self.assertJSONEqual(calls[1].request.body, '{"projects": ["project-id-1", "project-id-2"]}')
         self.assertTrue(isinstance(result_many, list))
         self.assertTrue(isinstance(result_many[0], Resource))
         assert result_many[0].id == 'project-id-1'
@@ -145,7 +164,7 @@ class TestProjects(ResourcesTestBase):
 
         self.assertEqual(len(calls), 1)
         self.assertEqual(calls[0].request.url, '/project-manager/describe-project')
-        self.assertEqual(calls[0].request.body, '{"project": "unknown-project"}')
+        self.assertJSONEqual(calls[0].request.body, '{"project": "unknown-project"}')
         self.assertEqual(calls[0].response.status, 404)
 
     @responses.activate
@@ -200,7 +219,7 @@ class TestProjects(ResourcesTestBase):
         self.assertEqual(len(calls), 1)
 
         self.assertEqual(calls[0].request.url, '/project-manager/update-project-name')
-        self.assertEqual(calls[0].request.body, '{"project": "project-id", "name": "new-name"}')
+        self.assertJSONEqual(calls[0].request.body, '{"project": "project-id", "name": "new-name"}')
 
         assert project.id == 'project-id'
         assert project.name == 'new-name'
@@ -0,0 +1,84 @@
+"""Tests for the API providers.
+
+"""
+
+import gzip
+import json
+import sys
+from unittest.mock import MagicMock, patch
+
+from alteia.apis.provider import Provider
+from tests.alteiatest import AlteiaTestBase
+
+
+class TestProvider(AlteiaTestBase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.provider = Provider(connection=self.connection)
+
+    def test_post_compression(self):
+        data = {'ids': [f'id-{i}' for i in range(100)]}
+
+        self.provider.post('describe-things', data=data)
+        kwargs = self.connection.post.call_args[1]
+        self.assertNotIn('Content-Encoding', kwargs['headers'])
+        self.assertEqual(json.loads(kwargs['data']), data)
+
+        self.provider.compress_min_size = 256
+        self.provider.post('describe-things', data=data)
+        kwargs = self.connection.post.call_args[1]
+        self.assertEqual(kwargs['headers']['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(kwargs['data'])), data)
+
+        self.provider.post('describe-things', data={'ids': ['id-0']})
+        kwargs = self.connection.post.call_args[1]
+        self.assertNotIn('Content-Encoding', kwargs['headers'])
+
+    def test_get_iter(self):
+        response = MagicMock(data=b'{"groups": [{"_id": "a"}, {"_id": "b"}]}')
+        self.connection.get.return_value = response
+
+        items = list(self.provider.get_iter('things', key='groups'))
+        self.assertEqual(items, [{'_id': 'a'}, {'_id': 'b'}])
+        self.assertFalse(self.connection.get.call_args[1]['preload_content'])
+        response.release_conn.assert_called_once()
+
+    def test_post_iter_closed_early(self):
+        response = MagicMock()
+        self.connection.post.return_value = response
+        ijson = MagicMock()
+        ijson.items.side_effect = lambda *args, **kwargs: iter([{'_id': 'a'}, {'_id': 'b'}])
+
+        with patch.dict(sys.modules, {'ijson': ijson}):
+            items = self.provider.post_iter('describe-things', data={})
+            self.assertEqual(next(items), {'_id': 'a'})
+            items.close()
+        response.close.assert_called_once()
+        response.release_conn.assert_called_once()
+
+        response.reset_mock()
+        with patch.dict(sys.modules, {'ijson': ijson}):
+            items = list(self.provider.post_iter('describe-things', data={}))
+        self.assertEqual(items, [{'_id': 'a'}, {'_id': 'b'}])
+        response.close.assert_not_called()
+        response.release_conn.assert_called_once()
+
+    def test_post_many(self):
+        self.connection.post.side_effect = lambda **kwargs: json.loads(kwargs['data'])['ids']
+
+        results = self.provider.post_many('describe-things', [{'ids': [i]} for i in range(10)])
+        self.assertEqual(results, [[i] for i in range(10)])
+        self.assertEqual(self.connection.post.call_count, 10)
+
+    def test_post_serialized(self):
+        data = b'{"ids": ["a.b"]}'
+
+        self.provider.post('describe-things', data=data)
+        kwargs = self.connection.post.call_args[1]
+        self.assertIs(kwargs['data'], data)
+        self.assertEqual(kwargs['headers']['Content-Type'], 'application/json')
+
+        self.provider.put('things', data=data)
+        kwargs = self.connection.put.call_args[1]
+        self.assertIs(kwargs['data'], data)
+        self.assertEqual(kwargs['headers']['Content-Type'], 'application/json')
@@ -78,3 +78,15 @@ class TestResourceBase(AlteiaTestBase):
 
         r.fake_attribute = 'value'
         self.assertEqual(r.fake_attribute, 'value')
+
+    def test_from_dict(self):
+        """Test resource creation from a description."""
+        r = Resource.from_dict(self.user_desc)
+        self.assertEqual(vars(r), vars(Resource(**self.user_desc)))
+        self.assertEqual(list(vars(r)), list(vars(Resource(**self.user_desc))))
+
+        r.lastName = 'Courbet'
+        self.assertEqual(self.user_desc['lastName'], 'Eiffel')
+
+        with self.assertRaises(KeyError):
+            Resource.from_dict({'name': 'value'})
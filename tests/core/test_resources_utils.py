@@ -0,0 +1,199 @@
+"""Tests for the generic resource managers functions.
+
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+from alteia.apis.provider import Provider
+from alteia.core.errors import ResponseError
+from alteia.core.resources.resource import Resource
+from alteia.core.resources.utils import (describe_iter, describe_many,
+                                         describe_many_async,
+                                         describe_many_cached,
+                                         search_generator)
+from alteia.core.utils.cache import TTLCache
+from tests.alteiatest import AlteiaTestBase
+
+
+class FakeProvider(Provider):
+    max_per_describe = 2
+
+    def __init__(self, max_accepted=None):
+        super().__init__(connection=None)
+        self.calls = []
+        self._max_accepted = max_accepted
+
+    def post_iter(self, path, data, **kwargs):
+        self.calls.append((path, data))
+        if self._max_accepted is not None and len(data['ids']) > self._max_accepted:
+            raise ResponseError('Payload Too Large', status=413)
+        return iter([{'_id': _id, 'tags': []} for _id in data['ids']])
+
+
+class FakeManager:
+    def __init__(self, nb_resources, page_size):
+        self._provider = FakeProvider()
+        self._resources = [Resource(_id=f'id-{i}') for i in range(nb_resources)]
+        self._page_size = page_size
+        self.pages = []
+
+    def search(self, *, filter=None, page=0, **kwargs):
+        self.pages.append(page)
+        start = page * self._page_size
+        return self._resources[start:start + self._page_size]
+
+
+class TestResourcesUtils(AlteiaTestBase):
+    """Tests for generic resource managers functions."""
+
+    def test_describe_many(self):
+        manager = FakeManager(0, 1)
+        ids = ['a', 'b', 'c', 'd', 'e']
+        results = describe_many(manager, url='describe-things', ids_param='ids',
+                                ids=ids, extra='value')
+
+        self.assertEqual([r.id for r in results], ids)
+        calls = manager._provider.calls
+        self.assertEqual(len(calls), 3)
+        for path, data in calls:
+            self.assertEqual(path, 'describe-things')
+            self.assertEqual(data['extra'], 'value')
+
+    def test_describe_many_async(self):
+        manager = FakeManager(0, 1)
+        ids = ['a', 'b', 'c', 'a', 'd']
+        results = asyncio.run(describe_many_async(manager, url='describe-things',
+                                                  ids_param='ids', ids=ids))
+
+        self.assertEqual([r.id for r in results], ids)
+        self.assertCountEqual([data['ids'] for _, data in manager._provider.calls],
+                              [['a', 'b'], ['c', 'd']])
+
+    def test_describe_many_empty(self):
+        manager = FakeManager(0, 1)
+        self.assertEqual(describe_many(manager, url='describe-things', ids_param='ids',
+                                       ids=[]), [])
+        self.assertEqual(describe_many_cached(manager, TTLCache(), url='describe-things',
+                                              ids_param='ids', ids=[]), [])
+        self.assertEqual(manager._provider.calls, [])
+
+    def test_describe_many_single_chunk(self):
+        manager = FakeManager(0, 1)
+        results = describe_many(manager, url='describe-things', ids_param='ids',
+                                ids=['a', 'b', 'a'])
+
+        self.assertEqual([r.id for r in results], ['a', 'b', 'a'])
+        self.assertEqual([data['ids'] for _, data in manager._provider.calls], [['a', 'b']])
+
+    def test_describe_iter(self):
+        manager = FakeManager(0, 1)
+        ids = ['a', 'b', 'c', 'd', 'e']
+        results = describe_iter(manager, url='describe-things', ids_param='ids', ids=ids)
+
+        self.assertEqual(next(results).id, 'a')
+        self.assertLessEqual(len(manager._provider.calls), 2)
+        self.assertEqual([r.id for r in results], ids[1:])
+        self.assertEqual(len(manager._provider.calls), 3)
+
+        self.assertEqual(list(describe_iter(manager, url='describe-things',
+                                            ids_param='ids', ids=[])), [])
+
+    def test_describe_many_with_duplicates(self):
+        manager = FakeManager(0, 1)
+        ids = ['a', 'b', 'a', 'c', 'b']
+        results = describe_many(manager, url='describe-things', ids_param='ids', ids=ids)
+
+        self.assertEqual([r.id for r in results], ids)
+        self.assertIsNot(results[0], results[2])
+        self.assertEqual([data['ids'] for _, data in manager._provider.calls],
+                         [['a', 'b'], ['c']])
+
+    def test_describe_many_too_large(self):
+        manager = FakeManager(0, 1)
+        manager._provider = FakeProvider(max_accepted=3)
+        manager._provider.max_per_describe = 8
+        ids = [f'id-{i}' for i in range(10)]
+        results = describe_many(manager, url='describe-things', ids_param='ids', ids=ids)
+
+        self.assertEqual([r.id for r in results], ids)
+        self.assertEqual(manager._provider.max_per_describe, 8)
+        self.assertEqual(manager._provider.describe_chunk_size(), 2)
+
+        # The lowered size is used by the next requests, until it expires
+        manager._provider.calls = []
+        describe_many(manager, url='describe-things', ids_param='ids', ids=ids)
+        self.assertEqual(len(manager._provider.calls), 5)
+        with patch('time.monotonic', return_value=time.monotonic() + 601):
+            self.assertEqual(manager._provider.describe_chunk_size(), 8)
+
+        with self.assertRaises(ResponseError):
+            FakeProvider(max_accepted=0).post_describe('describe-things', ids_param='ids',
+                                                       ids=['a'])
+
+    def test_describe_many_cached(self):
+        manager = FakeManager(0, 1)
+        cache = TTLCache()
+        results = describe_many_cached(manager, cache, url='describe-things',
+                                       ids_param='ids', ids=['a', 'b', 'c'])
+        self.assertEqual([r.id for r in results], ['a', 'b', 'c'])
+        self.assertEqual(len(manager._provider.calls), 2)
+
+        results = describe_many_cached(manager, cache, url='describe-things',
+                                       ids_param='ids', ids=['c', 'd', 'a'])
+        self.assertEqual([r.id for r in results], ['c', 'd', 'a'])
+        self.assertEqual(len(manager._provider.calls), 3)
+        self.assertEqual(manager._provider.calls[-1][1]['ids'], ['d'])
+
+        cache.invalidate('a')
+        describe_many_cached(manager, cache, url='describe-things',
+                             ids_param='ids', ids=['a', 'b'])
+        self.assertEqual(manager._provider.calls[-1][1]['ids'], ['a'])
+
+        results[0].name = 'modified'
+        results[0].tags.append('modified')
+        results = describe_many_cached(manager, cache, url='describe-things',
+                                       ids_param='ids', ids=['c'])
+        self.assertFalse(hasattr(results[0], 'name'))
+        self.assertEqual(results[0].tags, [])
+
+    def test_describe_many_cached_disabled(self):
+        manager = FakeManager(0, 1)
+        cache = TTLCache(ttl=0)
+        with patch('alteia.core.resources.utils.describe_cache_key') as key_mock, \
+                patch('alteia.core.resources.utils.copy_resource') as copy_mock:
+            results = describe_many_cached(manager, cache, url='describe-things',
+                                           ids_param='ids', ids=['a', 'b', 'c'])
+
+        self.assertEqual([r.id for r in results], ['a', 'b', 'c'])
+        key_mock.assert_not_called()
+        copy_mock.assert_not_called()
+
+    def test_describe_many_cached_with_duplicates(self):
+        manager = FakeManager(0, 1)
+        ids = ['a', 'b', 'a', 'c', 'b']
+        results = describe_many_cached(manager, TTLCache(), url='describe-things',
+                                       ids_param='ids', ids=ids)
+
+        self.assertEqual([r.id for r in results], ids)
+        self.assertIsNot(results[0], results[2])
+        self.assertEqual([data['ids'] for _, data in manager._provider.calls],
+                         [['a', 'b'], ['c']])
+
+    def test_search_generator(self):
+        for prefetch in (False, True):
+            manager = FakeManager(7, 3)
+            results = search_generator(manager, first_page=0, prefetch=prefetch)
+
+            self.assertEqual([r.id for r in results], [f'id-{i}' for i in range(7)])
+            self.assertEqual(manager.pages, [0, 1, 2, 3])
+
+    def test_search_generator_prefetch_stop_early(self):
+        manager = FakeManager(7, 3)
+        results = search_generator(manager, first_page=0, prefetch=True)
+
+        self.assertEqual(next(results).id, 'id-0')
+        results.close()
+        self.assertEqual(manager.pages[0], 0)
+        self.assertLessEqual(len(manager.pages), 2)
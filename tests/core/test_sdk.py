@@ -56,3 +56,17 @@ class TestSDK(ResourcesTestBase):
         sdk = alteia.SDK(user='username', password='password', service='service-foobar')
         self.assertEqual(sdk._connection.user_agent,
                          f'service-foobar {sdk._name} {BASE_USER_AGENT}')
+
+    @mock.patch('alteia.core.connection.token.TokenManager.renew_token')
+    @mock.patch('alteia.core.config.read_file')
+    def test_provider_settings(self, mock_read_file, *args):
+        mock_read_file.return_value = json.dumps({
+            'url': 'some url',
+            'connection': {'describe_cache_ttl': 30, 'compress_min_size': 2048}})
+        sdk = alteia.SDK(config_path='config.json', user='username', password='password')
+        for provider in sdk._providers.values():
+            self.assertEqual(provider.describe_cache_ttl, 30)
+            self.assertEqual(provider.compress_min_size, 2048)
+
+        sdk = alteia.SDK(user='username', password='password', url='some url')
+        self.assertIsNone(sdk._providers['data_management_api'].compress_min_size)
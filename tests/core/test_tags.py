@@ -203,6 +203,13 @@ class TestTags(ResourcesTestBase):
                 type='photo',
                 flight='flight-id')
 
+    def test_invalid_tag_type(self):
+        with self.assertRaises(ParameterError):
+            self.sdk.tags.create(name='my tag', project='project-id', type='unknown')
+
+        with self.assertRaises(ParameterError):
+            self.sdk.tags.search(project='project-id', type='unknown')
+
     @responses.activate
     def test_search_tags(self):
         responses.add('GET', '/project-manager/tags',
@@ -274,6 +281,23 @@ class TestTags(ResourcesTestBase):
         self.assertEqual(calls[0].request.url, '/project-manager/tags/tag-id')
         self.assertEqual(calls[0].request.method, 'DELETE')
 
+    @responses.activate
+    def test_delete_many_tags(self):
+        for tag_id in ('tag-1', 'tag-2', 'tag-3'):
+            responses.add('DELETE', f'/project-manager/tags/{tag_id}',
+                          body=TAG_DELETION_RESP_BODY,
+                          status=200,
+                          content_type='application/json')
+
+        self.sdk.tags.delete(tag=['tag-1', 'tag-2', 'tag-3'])
+
+        calls = responses.calls
+        self.assertEqual(len(calls), 3)
+        self.assertCountEqual([call.request.url for call in calls],
+                              ['/project-manager/tags/tag-1',
+                               '/project-manager/tags/tag-2',
+                               '/project-manager/tags/tag-3'])
+
     def test_convert_uisrv_desc_to_Tag(self):
         uisrv_desc = json.loads(TAG_CREATION_RESP_BODY).get('tag')
         tag = self.sdk.tags._convert_uisrv_desc_to_Tag(desc=uisrv_desc)
@@ -288,7 +312,9 @@ class TestTags(ResourcesTestBase):
 
     def test_convert_uisrv_desc_to_Tag_deleted(self):
         uisrv_desc = json.loads(TAG_DELETION_RESP_BODY).get('tag')
+        target = uisrv_desc['target']
         tag = self.sdk.tags._convert_uisrv_desc_to_Tag(desc=uisrv_desc)
+        self.assertEqual(target, {'type': 'photo', 'id': 'flight-id', 'subId': 'ds-id'})
         assert tag.__dict__ == Tag(
             id='tag-id',
             project='project-id',
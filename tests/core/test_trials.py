@@ -0,0 +1,71 @@
+import json
+from unittest.mock import patch
+
+from urllib3_mock import Responses
+
+from alteia.apis.client.seasonplanner.seasonplannermissionsimpl import \
+    SeasonPlannerMissionsImpl
+from alteia.apis.client.seasonplanner.trialsimpl import TrialsImpl
+from alteia.apis.provider import SeasonPlannerTrialManagementAPI
+from alteia.core.errors import ResponseError
+from tests.core.resource_test_base import ResourcesTestBase
+
+responses = Responses()
+
+
+class TestTrials(ResourcesTestBase):
+
+    def setUp(self):
+        provider = SeasonPlannerTrialManagementAPI(connection=self.sdk._connection,
+                                                   describe_cache_ttl=60)
+        self.trials = TrialsImpl(provider)
+        self.missions = SeasonPlannerMissionsImpl(provider)
+        self.trial_missions = []
+
+    def __describe_trial(self, request):
+        if json.loads(request.body)['trial'] != 'trial-id':
+            return 404, None, json.dumps({'message': 'Not found'})
+        return 200, None, json.dumps({'_id': 'trial-id', 'missions': self.trial_missions})
+
+    def __add_mission(self, request):
+        self.trial_missions = ['mission-id']
+        return 200, None, json.dumps({'_id': 'trial-id', 'missions': self.trial_missions})
+
+    @responses.activate
+    def test_describe_after_add_mission(self):
+        responses.add_callback('POST', '/season-planner/trial-management/describe-trial',
+                               callback=self.__describe_trial,
+                               content_type='application/json')
+        responses.add_callback('POST', '/season-planner/trial-management/add-mission-to-trial',
+                               callback=self.__add_mission,
+                               content_type='application/json')
+
+        self.assertEqual(self.trials.describe('trial-id').missions, [])
+        self.assertEqual(self.trials.describe('trial-id').missions, [])
+        self.assertEqual(len(responses.calls), 1)
+
+        self.missions.add_mission_to_trial(trial='trial-id', name='mission')
+        self.assertEqual(self.trials.describe('trial-id').missions, ['mission-id'])
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_describe_cache_disabled(self):
+        responses.add_callback('POST', '/season-planner/trial-management/describe-trial',
+                               callback=self.__describe_trial,
+                               content_type='application/json')
+
+        with patch('alteia.apis.client.seasonplanner.trialsimpl.copy_resource') as copy_mock:
+            self.sdk.trials.describe('trial-id')
+            self.sdk.trials.describe('trial-id')
+        self.assertEqual(len(responses.calls), 2)
+        copy_mock.assert_not_called()
+
+    @responses.activate
+    def test_describe_unknown_single_element_list(self):
+        responses.add_callback('POST', '/season-planner/trial-management/describe-trial',
+                               callback=self.__describe_trial,
+                               content_type='application/json')
+
+        self.assertEqual(self.trials.describe(['unknown-id']), [])
+        with self.assertRaises(ResponseError):
+            self.trials.describe('unknown-id')
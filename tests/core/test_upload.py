@@ -8,7 +8,8 @@ from alteia.core.resources.datamngt.upload import (DM_CHUNK_MAX_SIZE,
                                                    S3_CHUNK_MAX_PARTS,
                                                    S3_CHUNK_MAX_SIZE,
                                                    S3_CHUNK_MIN_SIZE,
-                                                   cfg_multipart_upload)
+                                                   cfg_multipart_upload,
+                                                   prepare_chunks)
 
 
 class UploadTest(TestCase):
@@ -53,3 +54,14 @@ class UploadTest(TestCase):
         multipart, chunk_size = cfg_multipart_upload(S3_CHUNK_MAX_PARTS * S3_CHUNK_MAX_SIZE - 1)
         self.assertTrue(multipart)
         self.assertEqual(chunk_size, min(S3_CHUNK_MAX_SIZE, DM_CHUNK_MAX_SIZE))
+
+    def test_prepare_chunks(self):
+        """Test preparation of the chunks of a file."""
+        chunks, chunk_size = prepare_chunks(file_size=10, chunk_size=4)
+        self.assertEqual(chunk_size, 4)
+        self.assertEqual([(c.index, c.size) for c in chunks], [(0, 4), (1, 4), (2, 2)])
+
+        file_size = 2 ** 53 + 1
+        chunks, chunk_size = prepare_chunks(file_size=file_size, chunk_size=S3_CHUNK_MAX_SIZE)
+        self.assertEqual(len(chunks), S3_CHUNK_MAX_PARTS)
+        self.assertEqual(sum(c.size for c in chunks), file_size)
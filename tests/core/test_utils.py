@@ -1,11 +1,21 @@
+import asyncio
 import copy
 import datetime
+import hashlib
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
 
 from alteia.core.config import ConnectionConfig
+from alteia.core.connection.async_connection import MAX_REQUESTS_WORKERS
 from alteia.core.errors import ConfigError
-from alteia.core.utils.utils import (dict_merge, find, flatten_dict,
-                                     get_chunks, new_instance, parse_timestamp,
-                                     sanitize_dict)
+from alteia.core.utils import json_utils
+from alteia.core.utils.cache import TTLCache
+from alteia.core.utils.utils import (concurrent_map, dict_merge, find,
+                                     flatten_dict, get_chunks,
+                                     get_running_loop, md5, new_instance,
+                                     parse_timestamp, sanitize_dict)
 from tests.alteiatest import AlteiaTestBase
 
 d1 = {
@@ -42,6 +52,10 @@ class TestUtils(AlteiaTestBase):
         sanitize_dict(dirty)
         self.assertDictEqual(dirty, {'key1': ['$value1', {'key2': 'value2'}]})
 
+        clean = {'b': 1, 'a': {'c.d': 2}}
+        sanitize_dict(clean)
+        self.assertEqual(list(clean.items()), [('b', 1), ('a', {'cd': 2})])
+
     def test_new_instance_existing(self):
         """Test instance creation for existing module and class."""
         instance = new_instance('alteia.core.config', 'ConnectionConfig')
@@ -106,6 +120,97 @@ class TestUtils(AlteiaTestBase):
             results += chunk
         self.assertEqual(results, my_list)
 
+    def test_concurrent_map(self):
+        self.assertEqual(concurrent_map(lambda x: x * 2, []), [])
+        self.assertEqual(concurrent_map(lambda x: x * 2, [1]), [2])
+        self.assertEqual(concurrent_map(lambda x: x * 2, range(20)),
+                         [x * 2 for x in range(20)])
+
+        with self.assertRaises(ZeroDivisionError):
+            concurrent_map(lambda x: 1 / x, [1, 0, 2])
+
+    def test_concurrent_map_nested(self):
+        # More nested calls than threads in the pool must not deadlock
+        results = concurrent_map(lambda x: concurrent_map(lambda y: x * y, range(3)),
+                                 range(MAX_REQUESTS_WORKERS * 2))
+        self.assertEqual(results[2], [0, 2, 4])
+
+    def test_asyncio_imported_lazily(self):
+        modules = ['alteia.apis.client.seasonplanner.fieldsimpl',
+                   'alteia.apis.client.seasonplanner.estimationmethodsimpl',
+                   'alteia.apis.client.seasonplanner.growthstagesimpl',
+                   'alteia.apis.client.seasonplanner.seasonplannermissionsimpl',
+                   'alteia.apis.client.seasonplanner.trialsimpl']
+        code = ('import sys\n'
+                + ''.join(f'import {module}\n' for module in modules)
+                + "sys.exit('asyncio' in sys.modules)")
+        self.assertEqual(subprocess.run([sys.executable, '-c', code]).returncode, 0)
+
+    def test_get_running_loop(self):
+        async def get_loop():
+            return get_running_loop()
+
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertIs(loop.run_until_complete(get_loop()), loop)
+        finally:
+            loop.close()
+
+
+class TestTTLCache(AlteiaTestBase):
+    def test_get_set(self):
+        cache = TTLCache(ttl=10, max_size=2)
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)  # evicts 'b', the least recently used
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_expiration(self):
+        cache = TTLCache(ttl=10)
+        with patch('alteia.core.utils.cache.time.monotonic', return_value=100):
+            cache.set('a', 1)
+        with patch('alteia.core.utils.cache.time.monotonic', return_value=105):
+            self.assertEqual(cache.get('a'), 1)
+        with patch('alteia.core.utils.cache.time.monotonic', return_value=111):
+            self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+
+    def test_disabled(self):
+        cache = TTLCache(ttl=0)
+        self.assertFalse(cache.enabled)
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate(self):
+        cache = TTLCache()
+        cache.set(('a', '{}'), 1)
+        cache.set(('a', '{"x": 1}'), 2)
+        cache.set(('b', '{}'), 3)
+        cache.invalidate('a')
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get(('b', '{}')), 3)
+
+
+class TestJSONUtils(AlteiaTestBase):
+    def test_dumps_loads(self):
+        obj = {'name': 'été', 'ids': ['a', 'b'], 'limit': 10, 'big': 2 ** 70}
+        for orjson in (json_utils._get_orjson(), None):
+            with patch('alteia.core.utils.json_utils._get_orjson', return_value=orjson):
+                data = json_utils.dumps(obj)
+                self.assertIsInstance(data, bytes)
+                self.assertIn('"name":"été"'.encode('utf-8'), data)
+                self.assertEqual(json_utils.loads(data), obj)
+                self.assertEqual(json_utils.loads(data.decode('utf-8')), obj)
+
+    def test_dumps_lone_surrogate(self):
+        with patch('alteia.core.utils.json_utils._get_orjson', return_value=None):
+            self.assertEqual(json_utils.dumps({'name': '\ud800'}), b'{"name":"\\ud800"}')
+
 
 class TestParseTimestamp(AlteiaTestBase):
     def test_timestamp_with_time_zone_separator(self):
@@ -122,3 +227,7 @@ class TestParseTimestamp(AlteiaTestBase):
         timestamp = '2021-12-08T14:14:18.344673387+00:00'
         self.assertEqual(parse_timestamp(timestamp),
                          datetime.datetime(2021, 12, 8, 14, 14, 18, 344673))
+
+    def test_md5(self):
+        file_path = Path(__file__).parent / 'DJI_0002.JPG'
+        self.assertEqual(md5(file_path), hashlib.md5(file_path.read_bytes()).hexdigest())